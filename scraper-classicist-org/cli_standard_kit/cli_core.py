@@ -2,11 +2,39 @@
 
 import argparse
 import sys
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 
 from .command_base import BaseCommand
 
 
+class _CachedFormatterParser(argparse.ArgumentParser):
+    """ArgumentParser that reuses one help formatter while adding arguments.
+
+    ``add_argument`` builds a formatter just to validate the new action's
+    metavar (twice on Python 3.14, where each one also checks the
+    environment for color support). Help and usage output keep getting a
+    fresh formatter because formatting is stateful. Subparsers inherit this
+    class through ``add_subparsers``.
+    """
+
+    _adding_argument = False
+    _argument_formatter: Optional[argparse.HelpFormatter] = None
+
+    def add_argument(self, *args, **kwargs):
+        self._adding_argument = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._adding_argument = False
+
+    def _get_formatter(self):
+        if not self._adding_argument:
+            return super()._get_formatter()
+        if self._argument_formatter is None:
+            self._argument_formatter = super()._get_formatter()
+        return self._argument_formatter
+
+
 class StandardCLI:
     """Main CLI framework that manages argparse and command execution.
     
@@ -40,7 +68,11 @@ class StandardCLI:
         self.epilog = epilog
         self.formatter_class = formatter_class or argparse.RawDescriptionHelpFormatter
         self._commands: Dict[str, BaseCommand] = {}
+        # Snapshot of the registered commands, taken when the parser is built
+        self._frozen_items: Optional[Tuple[Tuple[str, BaseCommand], ...]] = None
         self._parser: Optional[argparse.ArgumentParser] = None
+        self._subparsers: Dict[str, argparse.ArgumentParser] = {}
+        self._prepared: Set[str] = set()
     
     def register(self, command: BaseCommand) -> None:
         """Register a command with the CLI.
@@ -58,10 +90,19 @@ class StandardCLI:
             raise ValueError("Command must have a non-empty 'name' attribute")
         
         self._commands[command.name] = command
+        
+        # Rebuild the parser on the next run so the new command is included
+        self._parser = None
+        self._frozen_items = None
+        self._prepared.clear()
     
     def _build_parser(self) -> argparse.ArgumentParser:
-        """Build argument parser with all commands."""
-        parser = argparse.ArgumentParser(
+        """Build the root parser with global options and one stub per command.
+
+        Command-specific arguments are not added here; see
+        :meth:`_prepare_command`.
+        """
+        parser = _CachedFormatterParser(
             prog=self.prog,
             description=self.description,
             epilog=self.epilog,
@@ -112,42 +153,45 @@ class StandardCLI:
             version="%(prog)s 1.0.0"
         )
         
+        if self._frozen_items is None:
+            self._frozen_items = tuple(self._commands.items())
+        
         # Add subparsers for commands
-        if self._commands:
+        self._subparsers = {}
+        if self._frozen_items:
             subparsers = parser.add_subparsers(
                 dest='command',
                 help='Available commands',
                 metavar='COMMAND'
             )
             
-            # Add each command
-            for cmd_name, command in self._commands.items():
-                subparser = subparsers.add_parser(
+            # Help is added in _prepare_command so that "CMD --help" is
+            # not handled before the command's arguments exist.
+            for cmd_name, command in self._frozen_items:
+                self._subparsers[cmd_name] = subparsers.add_parser(
                     cmd_name,
                     help=command.description,
                     description=command.description,
-                    formatter_class=self.formatter_class
+                    formatter_class=self.formatter_class,
+                    add_help=False,
                 )
-                command.add_arguments(subparser)
         
         return parser
-        
-        subparsers = parser.add_subparsers(
-            dest="command",
-            help="Available commands",
-            metavar="COMMAND",
+    
+    def _prepare_command(self, name: str) -> None:
+        """Add the arguments of command ``name`` to its subparser (once)."""
+        if name in self._prepared:
+            return
+        
+        subparser = self._subparsers[name]
+        subparser.add_argument(
+            "-h", "--help",
+            action="help",
+            default=argparse.SUPPRESS,
+            help="show this help message and exit"
         )
-        
-        for cmd in self._commands.values():
-            subparser = subparsers.add_parser(
-                cmd.name,
-                help=cmd.description,
-                description=cmd.description,
-                formatter_class=self.formatter_class,
-            )
-            cmd.add_arguments(subparser)
-        
-        return parser
+        self._commands[name].add_arguments(subparser)
+        self._prepared.add(name)
     
     def run(self, args: Optional[list] = None) -> int:
         """Run the CLI with given arguments.
@@ -161,7 +205,16 @@ class StandardCLI:
         if args is None:
             args = sys.argv[1:]
         
-        self._parser = self._build_parser()
+        if self._parser is None:
+            self._parser = self._build_parser()
+        
+        # First pass only identifies the command, so that just that one
+        # command's arguments need to be added before the real parse.
+        known_args, _ = self._parser.parse_known_args(args)
+        command_name = getattr(known_args, 'command', None)
+        if command_name is not None:
+            self._prepare_command(command_name)
+        
         parsed_args = self._parser.parse_args(args)
         
         # If no command provided and we have commands, show help
@@ -1,5 +1,9 @@
 """Terminal color codes for consistent output formatting."""
 
+import os
+import sys
+
+
 class Colors:
     """ANSI terminal color codes and formatting."""
     RED = '\033[91m'
@@ -44,3 +48,65 @@ class MessageFormatter:
     @staticmethod
     def dry_run(message: str) -> str:
         return f"{Colors.CYAN}{Colors.BOLD}[DRY-RUN]{Colors.END} {message}"
+
+
+class PlainMessageFormatter:
+    """Message templates without ANSI codes, for pipes, log files and NO_COLOR."""
+    
+    @staticmethod
+    def success(message: str) -> str:
+        return f"[SUCCESS] {message}"
+    
+    @staticmethod
+    def error(message: str) -> str:
+        return f"[ERROR] {message}"
+    
+    @staticmethod
+    def warning(message: str) -> str:
+        return f"[WARNING] {message}"
+    
+    @staticmethod
+    def info(message: str) -> str:
+        return f"[INFO] {message}"
+    
+    @staticmethod
+    def process(message: str) -> str:
+        return f"[PROCESS] {message}"
+    
+    @staticmethod
+    def debug(message: str) -> str:
+        return f"[DEBUG] {message}"
+    
+    @staticmethod
+    def dry_run(message: str) -> str:
+        return f"[DRY-RUN] {message}"
+
+
+def colors_enabled(*streams) -> bool:
+    """Check whether colored output should be used.
+    
+    Args:
+        streams: Output streams to check (defaults to stdout and stderr)
+    
+    Returns:
+        True if NO_COLOR is unset and every stream is a terminal
+    """
+    if os.environ.get('NO_COLOR'):
+        return False
+    
+    streams = streams or (sys.stdout, sys.stderr)
+    return all(hasattr(stream, 'isatty') and stream.isatty() for stream in streams)
+
+
+def get_message_formatter(*streams):
+    """Pick the message formatter for the given output streams.
+    
+    Call once and keep the result rather than checking per message.
+    
+    Args:
+        streams: Output streams to check (defaults to stdout and stderr)
+    
+    Returns:
+        MessageFormatter when colors are enabled, else PlainMessageFormatter
+    """
+    return MessageFormatter if colors_enabled(*streams) else PlainMessageFormatter
@@ -1,7 +1,8 @@
 """Directory management for CLI applications."""
 
+import functools
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 
 def setup_directories(base_path: Path = None) -> Dict[str, Path]:
@@ -22,7 +23,23 @@ def setup_directories(base_path: Path = None) -> Dict[str, Path]:
     """
     if base_path is None:
         base_path = Path.cwd()
-    
+
+    base_path = Path(base_path)
+    # Relative paths depend on the working directory, so it is part of the
+    # cache key for them. Copy so callers can't modify the cached mapping.
+    cwd = None if base_path.is_absolute() else Path.cwd()
+    return dict(_setup_directories(base_path, cwd))
+
+
+@functools.lru_cache(maxsize=16)
+def _setup_directories(base_path: Path, cwd: Optional[Path]) -> Dict[str, Path]:
+    """Create the directory structure below ``base_path`` once per process.
+
+    ``cwd`` is only used as part of the cache key. Repeated calls for the
+    same base path (e.g. several commands in one long-running process) skip
+    the filesystem entirely; a directory removed after the first call is
+    not recreated.
+    """
     dirs = {
         'inputs': base_path / 'inputs',
         'outputs': base_path / 'outputs',
@@ -31,9 +48,10 @@ def setup_directories(base_path: Path = None) -> Dict[str, Path]:
         'logs': base_path / 'logs',
     }
     
-    # Create all directories
+    # Create all directories, stat-and-skip the ones that already exist
     for dir_path in dirs.values():
-        dir_path.mkdir(parents=True, exist_ok=True)
+        if not dir_path.is_dir():
+            dir_path.mkdir(parents=True, exist_ok=True)
     
     return dirs
 
@@ -6,22 +6,45 @@ from cli_standard_kit import StandardCLI
 from scraper.commands import ScrapeCommand, ListCommand, ScrapeDetailsCommand, ExportCommand
 
 
+COMMANDS = (ScrapeCommand, ListCommand, ScrapeDetailsCommand, ExportCommand)
+
+
+def _select_commands(argv):
+    """Pick the command classes needed to handle ``argv``.
+
+    A bare ``--version`` needs none and a recognized subcommand needs only
+    itself. Anything else (help, usage errors) gets all of them so the
+    full command list is shown.
+    """
+    if argv == ['--version']:
+        return ()
+
+    for arg in argv:
+        if not arg.startswith('-'):
+            for command_class in COMMANDS:
+                if command_class.name == arg:
+                    return (command_class,)
+            break
+
+    return COMMANDS
+
+
 def main():
     """Main entry point for the scraper CLI."""
+    argv = sys.argv[1:]
+
     cli = StandardCLI(
         "scraper-classicist",
         "Web scraper for classicist.org with standardized CLI interface"
     )
 
     # Register commands
-    cli.register(ScrapeCommand())
-    cli.register(ListCommand())
-    cli.register(ScrapeDetailsCommand())
-    cli.register(ExportCommand())
-    
+    for command_class in _select_commands(argv):
+        cli.register(command_class())
+
     # Run the CLI
-    return cli.run()
+    return cli.run(argv)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -9,11 +9,19 @@ __version__ = "0.1.0"
 __author__ = "Cenk Kabahasanoglu"
 __license__ = "MIT"
 
-# Scraper module exports
-from .commands import ScrapeCommand, ListCommand, ExportCommand
-from .scraper_core import ClassicistScraper
-from .parsers import HTMLParser, DataExtractor
-from .exporters import DataExporter
+import importlib
+
+# Scraper module exports, resolved on first access (PEP 562) so importing
+# ``scraper.commands`` does not drag in Playwright, bs4 and pandas.
+_LAZY_EXPORTS = {
+    'ScrapeCommand': '.commands',
+    'ListCommand': '.commands',
+    'ExportCommand': '.commands',
+    'ClassicistScraper': '.scraper_core',
+    'HTMLParser': '.parsers',
+    'DataExtractor': '.parsers',
+    'DataExporter': '.exporters',
+}
 
 __all__ = [
     # Commands
@@ -25,4 +33,17 @@ __all__ = [
     'HTMLParser',
     'DataExtractor',
     'DataExporter',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
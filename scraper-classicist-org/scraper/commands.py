@@ -1,18 +1,300 @@
 """CLI commands for scraper-classicist-org."""
 
-import asyncio
+import csv
+import functools
+import itertools
+import os
 import sys
+import time
+from collections import ChainMap
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from argparse import ArgumentParser
+from typing import TYPE_CHECKING, Callable, Iterator, List, Mapping, Optional, Dict, Any, Tuple
+from argparse import ArgumentParser, ArgumentTypeError
 
 from cli_standard_kit import BaseCommand
-from cli_standard_kit.colors import MessageFormatter
+from cli_standard_kit.colors import get_message_formatter
 from cli_standard_kit.logger import setup_logging
 from cli_standard_kit.directories import setup_directories
 
-from .scraper_core import ClassicistScraper
-from .exporters import DataExporter
+# Chosen once: plain [TAG] prefixes when output is piped or NO_COLOR is set
+MessageFormatter = get_message_formatter()
+_fmt_info = MessageFormatter.info
+_fmt_success = MessageFormatter.success
+_fmt_warning = MessageFormatter.warning
+_fmt_error = MessageFormatter.error
+_fmt_process = MessageFormatter.process
+_fmt_dry_run = MessageFormatter.dry_run
+
+# Playwright and pandas (see _get_pandas) are only imported by the commands
+# that use them, so `--help` and `list` stay fast.
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+    from .scraper_core import ClassicistScraper
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pandas():
+    """Import pandas on first use.
+
+    Only reading a .csv input file for export needs it (see
+    ExportCommand._load_data), and the import alone takes a noticeable
+    part of a second, so other commands never pay for it.
+    """
+    import pandas
+    return pandas
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logger(log_file: Optional[str], verbose: bool, quiet: bool):
+    """Return the CLI logger, configuring it only when the options change.
+
+    ``setup_logging`` reconfigures one shared logger, so only the most
+    recent configuration is cached.
+    """
+    return setup_logging(Path(log_file) if log_file else None, verbose, quiet)
+
+
+@functools.lru_cache(maxsize=None)
+def _install_uvloop() -> bool:
+    """Make asyncio use uvloop's libuv-based event loop when it is available.
+
+    Called by the async commands before they start a loop, so commands that
+    never touch asyncio don't pay for the import. uvloop has no Windows
+    support; everywhere it is missing the stock loop is kept.
+    """
+    if sys.platform == 'win32':
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    import asyncio
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _export_formats(value: str) -> List[str]:
+    """Parse an export ``--format`` value such as ``csv`` or ``csv,excel``."""
+    from .exporters import EXPORT_EXTENSIONS
+
+    formats = [fmt.strip() for fmt in value.split(',')]
+    for fmt in formats:
+        if fmt not in EXPORT_EXTENSIONS:
+            raise ArgumentTypeError(
+                f"invalid choice: '{fmt}' (choose from {', '.join(EXPORT_EXTENSIONS)})"
+            )
+    return formats
+
+
+def _walk_files(path: str, relative_path: str) -> Iterator[Tuple[str, int]]:
+    """Yield ``(relative_path, size)`` for every file below ``path``.
+
+    Uses ``os.scandir`` so file type checks come from the directory listing
+    and each file costs a single ``stat``. Entries are sorted one directory
+    at a time, which yields files in path order without collecting the
+    whole tree first. Symlinked directories are not followed.
+    """
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        entry_path = os.path.join(relative_path, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path, entry_path)
+        elif entry.is_file():
+            yield entry_path, entry.stat().st_size
+
+
+# Targets shown by `list --type targets`
+_TARGETS = (
+    "https://classicist.org/",
+    "https://classicist.org/issues/",
+    "https://classicist.org/archives/",
+    "https://classicist.org/about/",
+)
+
+
+# Fields returned by _DIRECTORY_MEMBER_DETAIL_JS, in output column order
+_DETAIL_FIELDS = (
+    'mailing_address', 'phone', 'email', 'about', 'social_media', 'photos',
+    'logo', 'highlights', 'field', 'city', 'state',
+)
+
+
+# Directory member page sections; the extractor runs once any of them is in
+# the DOM
+_DIRECTORY_MEMBER_DETAIL_READY = '#contacts, #info-position, #description'
+
+
+# Extractor for the directory's member pages read by scrape-details, as
+# window.__extractDirectoryMemberDetail. It is separate from the scraper's
+# generic window.__extractMemberDetail. Installed once per browser context
+# with add_init_script so the browser compiles it once instead of on every page.
+_DIRECTORY_MEMBER_DETAIL_JS = """
+() => {
+    // One regex test per element instead of a chain of includes() calls
+    const SOCIAL_RE = /facebook|twitter|linkedin|instagram|youtube/;
+    const MEMBER_IMAGE_RE = /member|firm|company/;
+    const MAX_PHOTOS = 3;
+    // (123) 456-7890 or 123-456-7890, with the shared tail matched once
+    const PHONE_RE = /(?:\\(\\d{3}\\)\\s*|\\d{3}-)\\d{3}-\\d{4}/;
+
+    const data = {
+        mailing_address: '',
+        phone: '',
+        email: '',
+        about: '',
+        social_media: [],
+        photos: [],
+        logo: '',
+        highlights: [],
+        field: '',
+        city: '',
+        state: ''
+    };
+
+    // Try multiple strategies to find member data
+
+    // Strategy 1: Extract from member-specific elements
+    // Based on actual page structure analysis
+
+    // Extract field/position from #info-position
+    const positionElement = document.querySelector('#info-position');
+    if (positionElement) {
+        data.field = positionElement.textContent.trim();
+    }
+
+    // Extract chapter from #info-chapter
+    const chapterElement = document.querySelector('#info-chapter');
+    if (chapterElement) {
+        // Could add chapter info if needed
+    }
+
+    // Extract contacts from #contacts section (looked up once, reused below)
+    const contactsSection = document.querySelector('#contacts');
+    if (contactsSection) {
+        // Extract email/website from #contacts-email
+        const emailElement = document.querySelector('#contacts-email');
+        if (emailElement) {
+            const emailText = emailElement.textContent.trim();
+            if (emailText && !emailText.includes('@')) {
+                // It's probably a website
+                data.email = emailText;
+            } else if (emailText.includes('@')) {
+                data.email = emailText;
+            }
+        }
+
+        // Extract address/phone from #contacts-address
+        const addressElement = document.querySelector('#contacts-address');
+        if (addressElement) {
+            const addressText = addressElement.textContent.trim();
+
+            // Split by line breaks to separate city/state from phone
+            const addressLines = addressText.split('\\n').map(line => line.trim()).filter(line => line);
+
+            // First line is usually city/state
+            if (addressLines.length > 0) {
+                const locationParts = addressLines[0].split(',');
+                if (locationParts.length >= 2) {
+                    data.city = locationParts[0].trim();
+                    data.state = locationParts[1].trim();
+                } else {
+                    data.city = addressLines[0];
+                }
+            }
+
+            // Look for phone in remaining lines
+            for (let i = 1; i < addressLines.length; i++) {
+                const line = addressLines[i];
+                // Check if line contains phone pattern
+                if (PHONE_RE.test(line)) {
+                    data.phone = line;
+                    break;
+                }
+            }
+        }
+    }
+
+    // Strategy 2: Look for about/description content
+    // Check for member description in various places, in one DOM pass
+    const aboutSelectors = [
+        '#description', '.description', '.member-description',
+        '.firm-description', '.company-description',
+        '#about', '.about', '.member-about',
+        'p:not(#contacts-address p):not(.footer p):not(.copyright p)'
+    ];
+
+    for (const element of document.querySelectorAll(aboutSelectors.join(', '))) {
+        const text = element.textContent.trim();
+        // Skip very short or very long text, and avoid footer content
+        if (text.length > 50 && text.length < 2000 &&
+            !element.closest('footer, .footer') &&
+            !text.includes('Copyright') &&
+            !text.includes('All rights reserved')) {
+
+            // Check if this looks like member description
+            const words = text.split('\\s+').length;
+            if (words > 10 && words < 500) {
+                if (!data.about || text.length > data.about.length) {
+                    data.about = text;
+                }
+            }
+        }
+    }
+
+    // Strategy 3: Extract social media from contacts section
+    if (contactsSection) {
+        for (const link of contactsSection.querySelectorAll('a[href]')) {
+            const platform = link.href.match(SOCIAL_RE);
+            if (platform) {
+                data.social_media.push({
+                    platform: platform[0],
+                    url: link.href,
+                    text: link.textContent.trim()
+                });
+            }
+        }
+    }
+
+    // Strategy 4: Extract images (member-specific)
+    // Images inside member content are collected with one selector query
+    // instead of two closest() walks per image
+    const contentImages = new Set(document.querySelectorAll(
+        'article img, .entry-content img, .member-content img, .firm-content img, .company-content img'
+    ));
+    // Stops once a logo and the first few photos have been found
+    for (const img of document.querySelectorAll('img')) {
+        const src = img.src;
+        if (src && src.length > 10) {
+            const alt = img.alt ? img.alt.toLowerCase() : '';
+
+            // Check if it's likely a member photo/logo
+            const isMemberImage = (
+                contentImages.has(img) ||
+                MEMBER_IMAGE_RE.test(src) ||
+                MEMBER_IMAGE_RE.test(alt)
+            );
+
+            if (isMemberImage) {
+                if (src.includes('logo') || alt.includes('logo')) {
+                    data.logo = src;
+                } else {
+                    data.photos.push({
+                        url: src,
+                        alt: img.alt || ''
+                    });
+                }
+
+                if (data.logo && data.photos.length >= MAX_PHOTOS) {
+                    break;
+                }
+            }
+        }
+    }
+
+    return data;
+}
+"""
 
 
 class ScrapeCommand(BaseCommand):
@@ -41,31 +323,83 @@ class ScrapeCommand(BaseCommand):
         )
         parser.add_argument(
             "--format",
-            choices=["json", "csv", "excel"],
+            choices=["json", "csv", "excel", "parquet"],
             default="json",
             help="Output format (default: json)"
         )
+        parser.add_argument(
+            "--chunksize",
+            type=int,
+            default=50000,
+            help="Rows written per batch when exporting CSV (default: 50000)"
+        )
+        parser.add_argument(
+            "--with-details",
+            action="store_true",
+            help="Also scrape every member's detail page (membership directory only)"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Detail pages loaded in parallel with --with-details (default: 4)"
+        )
+        parser.add_argument(
+            "--block-stylesheets",
+            action="store_true",
+            help="Do not download stylesheets (faster; page text then ignores CSS)"
+        )
     
     def run(self, args) -> int:
         """Execute scraping command."""
-        logger = setup_logging(args.log_file, args.verbose, args.quiet)
+        import asyncio
+
+        _install_uvloop()
+        return self._run_with(asyncio.run, args)
+
+    def run_in_loop(self, args, loop) -> int:
+        """Execute scraping command on an existing, not running, event loop.
+
+        For long-running hosts that keep one loop around instead of creating
+        and tearing one down per invocation. The loop is left open.
+        """
+        return self._run_with(loop.run_until_complete, args)
+
+    def _run_with(self, runner, args) -> int:
+        """Run the scrape coroutine with ``runner`` and report failures."""
+        if args.dry_run:
+            print(_fmt_dry_run(
+                f"Would scrape {args.url} (depth={args.depth}) and export as {args.format}"
+            ))
+            return 0
+        if args.chunksize < 1:
+            print(_fmt_error("--chunksize must be at least 1"), file=sys.stderr)
+            return 1
+        if args.concurrency < 1:
+            print(_fmt_error("--concurrency must be at least 1"), file=sys.stderr)
+            return 1
+
+        logger = _get_logger(args.log_file, args.verbose, args.quiet)
 
         # Run the async scraping
         try:
-            return asyncio.run(self._run_async(args, logger))
+            return runner(self._run_async(args, logger))
         except KeyboardInterrupt:
-            print(MessageFormatter.warning("Scraping interrupted by user"), file=sys.stderr)
+            print(_fmt_warning("Scraping interrupted by user"), file=sys.stderr)
             if logger:
                 logger.warning("Scraping interrupted by user")
             return 130
         except Exception as e:
-            print(MessageFormatter.error(f"Scraping failed: {str(e)}"), file=sys.stderr)
+            print(_fmt_error(f"Scraping failed: {str(e)}"), file=sys.stderr)
             if logger:
                 logger.exception("Scraping failed")
             return 1
 
     async def _run_async(self, args, logger) -> int:
         """Run the scraping asynchronously."""
+        from .scraper_core import ClassicistScraper
+        from .exporters import DataExporter
+
         try:
             # Setup directories
             if args.output_dir:
@@ -73,21 +407,34 @@ class ScrapeCommand(BaseCommand):
             else:
                 dirs = setup_directories()
 
-            print(MessageFormatter.process(f"Scraping {args.url}..."))
+            # Create the exporter (and its output directory) before the
+            # browser starts, so an unwritable output dir fails fast
+            exporter = DataExporter(dirs['outputs'], logger=logger)
+
+            print(_fmt_process(f"Scraping {args.url}..."))
 
             # Initialize and run scraper
-            async with ClassicistScraper(logger=logger, output_dir=dirs['outputs']) as scraper:
+            async with ClassicistScraper(logger=logger, output_dir=dirs['outputs'],
+                                         max_pages=args.concurrency,
+                                         block_stylesheets=args.block_stylesheets) as scraper:
                 # Perform scraping
                 if "membership-directory" in args.url:
                     data = await scraper.scrape_members_directory(args.url)
+                    if args.with_details:
+                        members = [m for m in data['members'] if m.get('detail_url')]
+                        print(_fmt_process(f"Scraping details for {len(members)} members..."))
+                        details = await scraper.scrape_member_details(
+                            [m['detail_url'] for m in members], max_concurrency=args.concurrency
+                        )
+                        for member, detail in zip(members, details):
+                            member.update(detail)
                 else:
                     data = await scraper.scrape(args.url, args.depth)
 
             # Export data
-            exporter = DataExporter(dirs['outputs'], logger=logger)
-            output_file = exporter.export(data, format=args.format)
+            output_file = exporter.export(data, format=args.format, chunksize=args.chunksize)
 
-            print(MessageFormatter.success(f"Scraping completed!"))
+            print(_fmt_success(f"Scraping completed!"))
             print(f"Data exported to: {output_file}")
 
             if args.log_file:
@@ -96,7 +443,7 @@ class ScrapeCommand(BaseCommand):
             return 0
 
         except Exception as e:
-            print(MessageFormatter.error(f"Scraping failed: {str(e)}"), file=sys.stderr)
+            print(_fmt_error(f"Scraping failed: {str(e)}"), file=sys.stderr)
             if logger:
                 logger.exception("Scraping failed")
             return 1
@@ -124,7 +471,7 @@ class ListCommand(BaseCommand):
     
     def run(self, args) -> int:
         """Execute list command."""
-        logger = setup_logging(args.log_file, args.verbose, args.quiet)
+        logger = _get_logger(args.log_file, args.verbose, args.quiet)
         
         try:
             if args.type == "targets":
@@ -135,22 +482,14 @@ class ListCommand(BaseCommand):
             return 0
             
         except Exception as e:
-            print(MessageFormatter.error(f"List failed: {str(e)}"), file=sys.stderr)
+            print(_fmt_error(f"List failed: {str(e)}"), file=sys.stderr)
             logger.exception("List failed")
             return 1
     
     def _list_targets(self):
         """List available scraping targets."""
-        targets = [
-            "https://classicist.org/",
-            "https://classicist.org/issues/",
-            "https://classicist.org/archives/",
-            "https://classicist.org/about/"
-        ]
-        
-        print(MessageFormatter.info("Available scraping targets:"))
-        for i, target in enumerate(targets, 1):
-            print(f"  {i}. {target}")
+        print(_fmt_info("Available scraping targets:"))
+        print("\n".join(f"  {i}. {target}" for i, target in enumerate(_TARGETS, 1)))
     
     def _list_data(self, data_dir: Optional[Path]):
         """List previously scraped data."""
@@ -158,19 +497,24 @@ class ListCommand(BaseCommand):
             data_dir = Path("./outputs")
         
         if not data_dir.exists():
-            print(MessageFormatter.warning("No data directory found"))
+            print(_fmt_warning("No data directory found"))
             return
         
-        files = list(data_dir.glob("**/*"))
-        if not files:
-            print(MessageFormatter.warning("No data files found"))
+        # Paths are shown relative to data_dir.parent, i.e. prefixed with
+        # the directory's own name. Files are printed as they are found.
+        files = _walk_files(str(data_dir), data_dir.name)
+        first = next(files, None)
+        if first is None:
+            print(_fmt_warning("No data files found"))
             return
         
-        print(MessageFormatter.info(f"Data files in {data_dir}:"))
-        for file_path in sorted(files):
-            if file_path.is_file():
-                size = file_path.stat().st_size
-                print(f"  {file_path.relative_to(data_dir.parent)} ({size} bytes)")
+        print(_fmt_info(f"Data files in {data_dir}:"))
+        # Lines are generated lazily and handed to the buffered stream in
+        # one call instead of one print() per file
+        sys.stdout.writelines(
+            f"  {relative_path} ({size} bytes)\n"
+            for relative_path, size in itertools.chain((first,), files)
+        )
 
 
 class ScrapeDetailsCommand(BaseCommand):
@@ -204,27 +548,69 @@ class ScrapeDetailsCommand(BaseCommand):
             type=Path,
             help="Output directory for detailed data"
         )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Number of member pages to scrape in parallel (default: 4)"
+        )
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=2.0,
+            help="Seconds between member requests per worker, plus up to 50%% random jitter (default: 2.0)"
+        )
+        parser.add_argument(
+            "--debug-html",
+            action="store_true",
+            help="Save each member page's HTML to the output directory for debugging"
+        )
+        parser.add_argument(
+            "--block-stylesheets",
+            action="store_true",
+            help="Do not download stylesheets (faster; page text then ignores CSS)"
+        )
 
     def run(self, args) -> int:
         """Execute detailed scraping command."""
-        logger = setup_logging(args.log_file, args.verbose, args.quiet)
+        if args.dry_run:
+            print(_fmt_dry_run(
+                f"Would scrape up to {args.limit} member detail pages from {args.input_file}, "
+                f"starting at row {args.start_from}"
+            ))
+            return 0
+
+        import asyncio
+
+        _install_uvloop()
+        logger = _get_logger(args.log_file, args.verbose, args.quiet)
 
         # Run the async scraping
         try:
             return asyncio.run(self._run_details_async(args, logger))
         except KeyboardInterrupt:
-            print(MessageFormatter.warning("Detail scraping interrupted by user"), file=sys.stderr)
+            print(_fmt_warning("Detail scraping interrupted by user"), file=sys.stderr)
             if logger:
                 logger.warning("Detail scraping interrupted by user")
             return 130
         except Exception as e:
-            print(MessageFormatter.error(f"Detail scraping failed: {str(e)}"), file=sys.stderr)
+            print(_fmt_error(f"Detail scraping failed: {str(e)}"), file=sys.stderr)
             if logger:
                 logger.exception("Detail scraping failed")
             return 1
 
     async def _run_details_async(self, args, logger) -> int:
         """Run detailed scraping asynchronously."""
+        import asyncio
+        from .scraper_core import ClassicistScraper, RateLimiter
+
+        if args.concurrency < 1:
+            print(_fmt_error("--concurrency must be at least 1"), file=sys.stderr)
+            return 1
+        if args.delay < 0:
+            print(_fmt_error("--delay must not be negative"), file=sys.stderr)
+            return 1
+
         try:
             # Setup directories
             if args.output_dir:
@@ -232,287 +618,191 @@ class ScrapeDetailsCommand(BaseCommand):
             else:
                 dirs = setup_directories()
 
-            # Load member data from CSV
-            import pandas as pd
-            df = pd.read_csv(args.input_file)
-
-            # Filter to members with detail URLs
-            members_with_urls = df[df['detail_url'].notna()]
+            # Load only the requested members with detail URLs
+            start_idx = args.start_from
+            input_columns, selected_members = self._read_member_slice(args.input_file, start_idx, args.limit)
 
-            if len(members_with_urls) == 0:
-                print(MessageFormatter.warning("No members with detail URLs found"))
+            if len(selected_members) == 0:
+                print(_fmt_warning("No members with detail URLs found in the selected range"))
                 return 1
 
-            # Apply limits
-            start_idx = args.start_from
-            end_idx = min(start_idx + args.limit, len(members_with_urls))
+            end_idx = start_idx + len(selected_members)
 
-            selected_members = members_with_urls.iloc[start_idx:end_idx]
-
-            print(MessageFormatter.process(f"Scraping details for {len(selected_members)} members ({start_idx}-{end_idx-1})..."))
+            print(_fmt_process(f"Scraping details for {len(selected_members)} members ({start_idx}-{end_idx-1})..."))
 
             # Initialize scraper
-            async with ClassicistScraper(logger=logger, output_dir=dirs['outputs']) as scraper:
-                detailed_members = []
-
-                for i, (_, member_row) in enumerate(selected_members.iterrows()):
-                    member_name = member_row['name']
-                    detail_url = member_row['detail_url']
-
+            async with ClassicistScraper(delay=args.delay, logger=logger, output_dir=dirs['outputs'],
+                                         max_pages=args.concurrency,
+                                         block_stylesheets=args.block_stylesheets) as scraper:
+                await scraper.context.add_init_script(
+                    script=f"window.__extractDirectoryMemberDetail = {_DIRECTORY_MEMBER_DETAIL_JS};"
+                )
+
+                # --concurrency workers share the scraper's page pool
+                # (max_pages=--concurrency), which saves creating a page per
+                # member; the limiter spaces out request starts so parallel
+                # workers stay as polite as the old serial delay. Jitter keeps
+                # the request starts from falling on a fixed beat.
+                total = len(selected_members)
+                limiter = RateLimiter(args.concurrency, scraper.delay, jitter=0.5)
+
+                # Rows are written as members finish, so partial results
+                # survive a crash. Finished rows wait in `pending` until all
+                # earlier members are done, which keeps the input order.
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                output_file = dirs['outputs'] / f"detailed_members_{timestamp}.csv"
+                fieldnames = input_columns + [field for field in _DETAIL_FIELDS if field not in input_columns]
+                pending: Dict[int, Optional[Mapping[str, Any]]] = {}
+                next_row = 0
+                written = 0
+                # One progress line redrawn at most ~10 times a second,
+                # instead of a line per member
+                done = 0
+                last_progress = 0.0
+                progress_shown = False
+
+                def finish(i, row):
+                    nonlocal next_row, written, done, last_progress, progress_shown
+                    pending[i] = row
+                    while next_row in pending:
+                        ready = pending.pop(next_row)
+                        if ready is not None:
+                            writer.writerow(ready)
+                            written += 1
+                        next_row += 1
+                    f.flush()
+
+                    done += 1
+                    now = time.monotonic()
+                    if done == total or now - last_progress >= 0.1:
+                        last_progress = now
+                        print(f"\r📊 Processing: {done}/{total} ({done / total * 100:.1f}%)", end="", flush=True)
+                        progress_shown = True
+
+                def report_failure(message):
+                    nonlocal progress_shown
+                    # Start a new line so the message doesn't land inside
+                    # the unfinished progress line
+                    print(("\n" if progress_shown else "") + _fmt_error(message), file=sys.stderr)
+                    progress_shown = False
+                    if logger:
+                        logger.error(message)
+
+                async def scrape_member(i, member_info):
+                    member_name = member_info['name']
                     try:
-                        if logger:
-                            logger.info(f"Scraping details for {member_name} ({i+1}/{len(selected_members)})")
+                        async with scraper.acquire_page() as page:
+                            await limiter.acquire()
 
-                        print(f"Processing: {member_name}")
+                            if logger:
+                                logger.debug(f"Scraping details for {member_name} ({i+1}/{total})")
 
-                        # Scrape member details
-                        detail_data = await self._scrape_single_member_details(scraper, detail_url, member_name)
+                            detail_data = await self._scrape_single_member_details(
+                                scraper, page, member_info['detail_url'], member_name, debug_html=args.debug_html,
+                                report_failure=report_failure
+                            )
+                    except Exception as e:
+                        report_failure(f"Failed to scrape details for {member_name}: {str(e)}")
+                        finish(i, None)
+                        return
 
-                        # Combine basic info with details
-                        member_info = member_row.to_dict()
-                        member_info.update(detail_data)
-                        detailed_members.append(member_info)
+                    # Combine basic info with details; the detail values take
+                    # precedence, without copying either dict
+                    finish(i, ChainMap(detail_data, member_info))
 
-                        # Add delay between requests
-                        if i < len(selected_members) - 1:
-                            await asyncio.sleep(2.0)  # 2 second delay
+                # Workers take the next member from a shared iterator, so no
+                # more than --concurrency members are in flight at once
+                queue = iter(enumerate(selected_members))
 
-                    except Exception as e:
-                        error_msg = f"Failed to scrape details for {member_name}: {str(e)}"
-                        print(MessageFormatter.error(error_msg))
-                        if logger:
-                            logger.error(error_msg)
-                        continue
-
-            # Export detailed data
-            import pandas as pd
-            detailed_df = pd.DataFrame(detailed_members)
-            timestamp = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-            output_file = dirs['outputs'] / f"detailed_members_{timestamp}.csv"
-            detailed_df.to_csv(output_file, index=False)
-
-            print(MessageFormatter.success(f"Detail scraping completed!"))
-            print(f"Processed {len(detailed_members)} members")
+                async def worker():
+                    for i, member_info in queue:
+                        await scrape_member(i, member_info)
+
+                with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                    writer.writeheader()
+                    try:
+                        await asyncio.gather(*(worker() for _ in range(min(args.concurrency, total))))
+                    finally:
+                        # End the progress line
+                        if progress_shown:
+                            print()
+
+            print(_fmt_success(f"Detail scraping completed!"))
+            print(f"Processed {written} members")
             print(f"Data exported to: {output_file}")
 
             return 0
 
         except Exception as e:
-            print(MessageFormatter.error(f"Detail scraping failed: {str(e)}"), file=sys.stderr)
+            print(_fmt_error(f"Detail scraping failed: {str(e)}"), file=sys.stderr)
             if logger:
                 logger.exception("Detail scraping failed")
             return 1
 
-    async def _scrape_single_member_details(self, scraper: ClassicistScraper, url: str, member_name: str = "") -> Dict[str, Any]:
-        """Scrape details for a single member."""
+    @staticmethod
+    def _read_member_slice(input_file: Path, start: int, limit: int) -> Tuple[List[str], List[Dict[str, str]]]:
+        """Return the input columns and members ``start`` to ``start + limit`` that have a detail URL.
+
+        Every input column is kept, so the detailed CSV carries all of the
+        directory data; reading stops as soon as the slice is complete.
+        """
+        with open(input_file, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            columns = list(reader.fieldnames or ())
+            members = (row for row in reader if row.get('detail_url'))
+            selected = list(itertools.islice(members, start, start + limit))
+        return columns, selected
+
+    async def _scrape_single_member_details(self, scraper: "ClassicistScraper", page: "Page", url: str,
+                                            member_name: str = "", debug_html: bool = False,
+                                            report_failure: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Scrape details for a single member using an already-open page.
+
+        A failure leaves the details empty and is passed to ``report_failure``
+        when given, otherwise logged as a warning.
+        """
+        import asyncio
+
         detail_data = {}
 
         try:
-            # Create a new page for this request
-            if not scraper.context:
-                raise RuntimeError("Browser context not initialized")
-
-            page = await scraper.context.new_page()
-            page.set_default_timeout(scraper.timeout)
-
-            await page.goto(url, wait_until='networkidle')
-            await page.wait_for_timeout(2000)
-
-            # Debug: Save HTML for analysis (only for first few members)
-            if member_name and scraper.logger:
+            # Wait for the sections the extractor reads instead of for the
+            # network to go quiet
+            await page.goto(url, wait_until='domcontentloaded')
+            try:
+                await page.wait_for_selector(_DIRECTORY_MEMBER_DETAIL_READY, state='attached', timeout=scraper.timeout)
+            except Exception as e:
+                # Extract whatever the page has
+                if scraper.logger:
+                    scraper.logger.debug(f"No member detail sections found on {url}: {e}")
+
+            # Debug: Save HTML for analysis
+            if debug_html:
                 try:
-                    debug_html = await page.content()
-                    safe_name = member_name.replace('/', '_').replace('\\', '_')[:30]
+                    html = await page.content()
+                    safe_name = (member_name or 'member').replace('/', '_').replace('\\', '_')[:30]
                     debug_file = scraper.output_dir / f"debug_{safe_name}.html"
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(debug_html)
-                    scraper.logger.info(f"Saved debug HTML for {member_name}: {debug_file}")
+                    # Written on a worker thread so other pages keep loading
+                    await asyncio.to_thread(debug_file.write_text, html, encoding='utf-8')
+                    if scraper.logger:
+                        scraper.logger.info(f"Saved debug HTML for {member_name}: {debug_file}")
                 except Exception as e:
-                    scraper.logger.warning(f"Failed to save debug HTML: {e}")
+                    if scraper.logger:
+                        scraper.logger.warning(f"Failed to save debug HTML: {e}")
 
             # Extract detailed member information
-            member_details = await page.evaluate("""
-                () => {
-                    const data = {
-                        mailing_address: '',
-                        phone: '',
-                        email: '',
-                        about: '',
-                        social_media: [],
-                        photos: [],
-                        logo: '',
-                        highlights: [],
-                        field: '',
-                        city: '',
-                        state: ''
-                    };
-
-                    // Try multiple strategies to find member data
-
-                    // Strategy 1: Extract from member-specific elements
-                    // Based on actual page structure analysis
-
-                    // Extract field/position from #info-position
-                    const positionElement = document.querySelector('#info-position');
-                    if (positionElement) {
-                        data.field = positionElement.textContent.trim();
-                    }
-
-                    // Extract chapter from #info-chapter
-                    const chapterElement = document.querySelector('#info-chapter');
-                    if (chapterElement) {
-                        // Could add chapter info if needed
-                    }
-
-                    // Extract contacts from #contacts section
-                    const contactsSection = document.querySelector('#contacts');
-                    if (contactsSection) {
-                        // Extract email/website from #contacts-email
-                        const emailElement = document.querySelector('#contacts-email');
-                        if (emailElement) {
-                            const emailText = emailElement.textContent.trim();
-                            if (emailText && !emailText.includes('@')) {
-                                // It's probably a website
-                                data.email = emailText;
-                            } else if (emailText.includes('@')) {
-                                data.email = emailText;
-                            }
-                        }
-
-                        // Extract address/phone from #contacts-address
-                        const addressElement = document.querySelector('#contacts-address');
-                        if (addressElement) {
-                            const addressText = addressElement.textContent.trim();
-
-                            // Split by line breaks to separate city/state from phone
-                            const addressLines = addressText.split('\\n').map(line => line.trim()).filter(line => line);
-
-                            // First line is usually city/state
-                            if (addressLines.length > 0) {
-                                const locationParts = addressLines[0].split(',');
-                                if (locationParts.length >= 2) {
-                                    data.city = locationParts[0].trim();
-                                    data.state = locationParts[1].trim();
-                                } else {
-                                    data.city = addressLines[0];
-                                }
-                            }
-
-                            // Look for phone in remaining lines
-                            for (let i = 1; i < addressLines.length; i++) {
-                                const line = addressLines[i];
-                                // Check if line contains phone pattern
-                                if (/\\(\\d{3}\\)\\s*\\d{3}-\\d{4}|\\d{3}-\\d{3}-\\d{4}/.test(line)) {
-                                    data.phone = line;
-                                    break;
-                                }
-                            }
-                        }
-                    }
-
-                    // Strategy 2: Look for about/description content
-                    // Check for member description in various places
-                    const aboutSelectors = [
-                        '#description', '.description', '.member-description',
-                        '.firm-description', '.company-description',
-                        '#about', '.about', '.member-about',
-                        'p:not(#contacts-address p):not(.footer p):not(.copyright p)'
-                    ];
-
-                    for (const selector of aboutSelectors) {
-                        const elements = document.querySelectorAll(selector);
-                        for (const element of elements) {
-                            const text = element.textContent.trim();
-                            // Skip very short or very long text, and avoid footer content
-                            if (text.length > 50 && text.length < 2000 &&
-                                !element.closest('footer, .footer') &&
-                                !text.includes('Copyright') &&
-                                !text.includes('All rights reserved')) {
-
-                                // Check if this looks like member description
-                                const words = text.split('\\s+').length;
-                                if (words > 10 && words < 500) {
-                                    if (!data.about || text.length > data.about.length) {
-                                        data.about = text;
-                                    }
-                                }
-                            }
-                        }
-                    }
-
-                    // Strategy 3: Extract social media from contacts section
-                    const contactsElement = document.querySelector('#contacts');
-                    if (contactsElement) {
-                        const socialLinks = contactsElement.querySelectorAll('a[href*="facebook"], a[href*="twitter"], a[href*="linkedin"], a[href*="instagram"], a[href*="youtube"]');
-
-                        socialLinks.forEach(link => {
-                            const platform = link.href.includes('facebook') ? 'facebook' :
-                                           link.href.includes('twitter') ? 'twitter' :
-                                           link.href.includes('linkedin') ? 'linkedin' :
-                                           link.href.includes('instagram') ? 'instagram' :
-                                           link.href.includes('youtube') ? 'youtube' : 'other';
-
-                            data.social_media.push({
-                                platform: platform,
-                                url: link.href,
-                                text: link.textContent.trim()
-                            });
-                        });
-                    }
-
-                    // Strategy 4: Extract images (member-specific)
-                    const images = document.querySelectorAll('img');
-                    images.forEach(img => {
-                        if (img.src && img.src.length > 10) {
-                            // Check if it's likely a member photo/logo
-                            const isMemberImage = (
-                                img.src.includes('member') ||
-                                img.src.includes('firm') ||
-                                img.src.includes('company') ||
-                                img.closest('.member-content, .firm-content, .company-content') ||
-                                img.closest('article, .entry-content') ||
-                                (img.alt && (
-                                    img.alt.toLowerCase().includes('firm') ||
-                                    img.alt.toLowerCase().includes('company') ||
-                                    img.alt.toLowerCase().includes('member')
-                                ))
-                            );
-
-                            if (isMemberImage) {
-                                if (img.src.includes('logo') || img.alt?.toLowerCase().includes('logo')) {
-                                    data.logo = img.src;
-                                } else {
-                                    data.photos.push({
-                                        url: img.src,
-                                        alt: img.alt || ''
-                                    });
-                                }
-                            }
-                        }
-                    });
-
-                    // Strategy 5: Parse location from address if found
-                    if (data.mailing_address) {
-                        const addressParts = data.mailing_address.split(',');
-                        if (addressParts.length >= 2) {
-                            data.city = addressParts[addressParts.length - 2].trim();
-                            const stateZip = addressParts[addressParts.length - 1].trim().split(' ');
-                            if (stateZip.length >= 1) {
-                                data.state = stateZip[0];
-                            }
-                        }
-                    }
-
-                    return data;
-                }
-            """)
+            # The extractor is installed on the context by _run_details_async
+            member_details = await page.evaluate("() => window.__extractDirectoryMemberDetail()")
 
             detail_data.update(member_details)
-            await page.close()
 
         except Exception as e:
-            if scraper.logger:
-                scraper.logger.warning(f"Failed to scrape member details from {url}: {str(e)}")
+            message = f"Failed to scrape member details from {url}: {str(e)}"
+            if report_failure:
+                report_failure(message)
+            elif scraper.logger:
+                scraper.logger.warning(message)
 
         return detail_data
 
@@ -528,52 +818,117 @@ class ExportCommand(BaseCommand):
         parser.add_argument(
             "input_file",
             type=Path,
-            help="Input data file to export"
+            help="Input data file to export (.json, .jsonl or .csv)"
         )
         parser.add_argument(
             "--format",
-            choices=["json", "csv", "excel"],
+            type=_export_formats,
             required=True,
-            help="Export format"
+            metavar="FORMAT[,FORMAT...]",
+            help="Export format(s), comma-separated: json, csv, excel or parquet; "
+                 "several formats are written in parallel"
         )
         parser.add_argument(
             "--output",
             type=Path,
-            help="Output file path (default: auto-generated)"
+            help="Output file path, with the suffix swapped per format when exporting several (default: auto-generated)"
+        )
+        parser.add_argument(
+            "--chunksize",
+            type=int,
+            default=50000,
+            help="Rows written per batch when exporting CSV (default: 50000)"
         )
     
     def run(self, args) -> int:
         """Execute export command."""
-        logger = setup_logging(args.log_file, args.verbose, args.quiet)
+        if args.dry_run:
+            print(_fmt_dry_run(
+                f"Would export {args.input_file} as {', '.join(args.format)}"
+                + (f" to {args.output}" if args.output else "")
+            ))
+            return 0
+        if args.chunksize < 1:
+            print(_fmt_error("--chunksize must be at least 1"), file=sys.stderr)
+            return 1
+
+        from .exporters import DataExporter, EXPORT_EXTENSIONS
+
+        logger = _get_logger(args.log_file, args.verbose, args.quiet)
+        formats = list(dict.fromkeys(args.format))
         
         try:
             # Validate input file
             if not args.input_file.exists():
-                print(MessageFormatter.error(f"Input file not found: {args.input_file}"))
+                print(_fmt_error(f"Input file not found: {args.input_file}"))
                 return 1
             
-            # Load data (simplified - in real implementation, would detect format)
-            import json
-            with open(args.input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._load_data(args.input_file)
             
             # Export data
             if args.output:
-                output_file = args.output
                 output_dir = args.output.parent
             else:
                 dirs = setup_directories()
                 output_dir = dirs['outputs']
-                output_file = None
             
             exporter = DataExporter(output_dir, logger=logger)
-            result_file = exporter.export(data, format=args.format, output_file=output_file)
             
-            print(MessageFormatter.success(f"Data exported to: {result_file}"))
+            # Pick every file name up front so several formats share one
+            # timestamp (or one --output stem)
+            if args.output and len(formats) == 1:
+                output_files = {formats[0]: args.output}
+            elif args.output:
+                output_files = {fmt: args.output.with_suffix(f".{EXPORT_EXTENSIONS[fmt]}") for fmt in formats}
+            else:
+                output_files = {fmt: exporter.default_output_file(fmt) for fmt in formats}
+            
+            if len(formats) == 1:
+                result_files = [exporter.export(data, format=formats[0], output_file=output_files[formats[0]],
+                                                chunksize=args.chunksize)]
+            else:
+                # Formats are written side by side on threads: they share
+                # the loaded data instead of each pickling a copy into a
+                # child process, and their log records reach the logger
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+                    futures = [pool.submit(exporter.export, data, fmt, output_files[fmt], args.chunksize) for fmt in formats]
+                    result_files = [future.result() for future in futures]
+            
+            for result_file in result_files:
+                print(_fmt_success(f"Data exported to: {result_file}"))
             
             return 0
             
         except Exception as e:
-            print(MessageFormatter.error(f"Export failed: {str(e)}"), file=sys.stderr)
+            print(_fmt_error(f"Export failed: {str(e)}"), file=sys.stderr)
             logger.exception("Export failed")
-            return 1
\ No newline at end of file
+            return 1
+    
+    def _load_data(self, input_file: Path) -> Dict[str, Any]:
+        """Load scraped data, choosing the reader from the file extension.
+        
+        JSON files are loaded as-is. JSON Lines and CSV files are read as
+        one member per line/row.
+        """
+        suffix = input_file.suffix.lower()
+        
+        if suffix == '.csv':
+            pd = _get_pandas()
+            df = pd.read_csv(input_file, keep_default_na=False)
+            if 'certified' in df.columns:
+                df['certified'] = df['certified'].eq('Yes')
+            return {'members': df.to_dict('records')}
+        
+        try:
+            # Parses bytes directly, several times faster than json
+            from orjson import loads
+        except ImportError:
+            from json import loads
+        
+        if suffix == '.jsonl':
+            with open(input_file, 'rb') as f:
+                return {'members': [loads(line) for line in f if line.strip()]}
+        
+        with open(input_file, 'rb') as f:
+            return loads(f.read())
@@ -1,12 +1,83 @@
 """Data export utilities for scraper-classicist-org."""
 
+import io
 import json
 import csv
-import pandas as pd
+import re
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional, see the 'fast' extra
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:  # optional, see the 'excel' extra; pandas/openpyxl otherwise
+    xlsxwriter = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert a value neither JSON encoder handles natively.
+
+    numpy scalars and arrays become Python values; anything else, including
+    datetimes (which orjson is told not to format itself), becomes str().
+    """
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    return str(obj)
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize ``obj`` as UTF-8 JSON indented by two spaces.
+
+    Uses orjson when it is installed, otherwise the stdlib encoder. Both
+    share _json_default(), so datetimes, numpy values and other objects come
+    out the same, but a few things still differ: orjson writes NaN and
+    Infinity as null where json writes NaN/Infinity, drops the ``+`` and
+    leading zero of float exponents (1e16, not 1e+16), and rejects integers
+    beyond 64 bits.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+# File extension used for each export format
+EXPORT_EXTENSIONS = {'json': 'json', 'csv': 'csv', 'excel': 'xlsx', 'parquet': 'parquet'}
+
+
+# Whitespace runs collapsed to a single space in content previews
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Write buffer for exported files; large exports are emitted in many small
+# chunks, so a bigger buffer means far fewer write() calls
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+# Rows handed to the CSV/Excel writers per batch
+DEFAULT_CHUNKSIZE = 50000
+
+
+def _iter_chunks(iterable, chunksize: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``chunksize`` items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
 
 class DataExporter:
     """Utility class for exporting scraped data to various formats."""
@@ -20,32 +91,55 @@ class DataExporter:
         """
         self.output_dir = Path(output_dir)
         self.logger = logger
+        # Timestamp for default file names, refreshed by export() when it
+        # has to pick the file name itself
+        self._timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def export(self, data: Dict[str, Any], 
                format: str = "json", 
-               output_file: Optional[Path] = None) -> Path:
+               output_file: Optional[Path] = None,
+               chunksize: Optional[int] = DEFAULT_CHUNKSIZE) -> Path:
         """Export data to the specified format.
         
         Args:
             data: Data to export
-            format: Export format ('json', 'csv', 'excel')
+            format: Export format ('json', 'csv', 'excel', 'parquet')
             output_file: Optional output file path
+            chunksize: Rows flattened and written per batch for CSV, so
+                only one batch is held in memory at a time; None flattens
+                everything before writing
             
         Returns:
             Path to the exported file
         """
+        if output_file is None:
+            self._timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         if format == "json":
             return self._export_json(data, output_file)
         elif format == "csv":
-            return self._export_csv(data, output_file)
+            return self._export_csv(data, output_file, chunksize)
         elif format == "excel":
             return self._export_excel(data, output_file)
+        elif format == "parquet":
+            return self._export_parquet(data, output_file)
         else:
             raise ValueError(f"Unsupported format: {format}")
     
+    def default_output_file(self, format: str) -> Path:
+        """Return the timestamped default path for an export in ``format``.
+        
+        Args:
+            format: Export format ('json', 'csv', 'excel', 'parquet')
+            
+        Returns:
+            Path inside the output directory
+        """
+        return self.output_dir / f"scraped_data_{self._timestamp}.{EXPORT_EXTENSIONS[format]}"
+    
     def _export_json(self, data: Dict[str, Any], 
                      output_file: Optional[Path] = None) -> Path:
         """Export data as JSON.
@@ -58,14 +152,22 @@ class DataExporter:
             Path to the exported JSON file
         """
         if output_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"scraped_data_{timestamp}.json"
-        
-        # Prepare data for JSON export
-        json_data = self._prepare_for_json(data)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
+            output_file = self.default_output_file('json')
+        
+        # Write the envelope, then the members/pages one at a time, so the
+        # whole document never has to be built in memory
+        envelope, key, items = self._prepare_for_json(data)
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            # Drop the closing "\n}" and reopen the object for the list
+            f.write(_dump_json(envelope)[:-2])
+            f.write(b',\n  ' + _dump_json(key) + b': [')
+            empty = True
+            for item in items:
+                f.write(b'\n    ' if empty else b',\n    ')
+                # Nest the item two levels deep
+                f.write(_dump_json(item).replace(b'\n', b'\n    '))
+                empty = False
+            f.write(b']\n}' if empty else b'\n  ]\n}')
         
         if self.logger:
             self.logger.info(f"Data exported to JSON: {output_file}")
@@ -73,42 +175,40 @@ class DataExporter:
         return output_file
     
     def _export_csv(self, data: Dict[str, Any], 
-                    output_file: Optional[Path] = None) -> Path:
+                    output_file: Optional[Path] = None,
+                    chunksize: Optional[int] = DEFAULT_CHUNKSIZE) -> Path:
         """Export data as CSV.
         
         Args:
             data: Data to export
             output_file: Optional output file path
+            chunksize: Rows flattened and written per batch (None for all)
             
         Returns:
             Path to the exported CSV file
         """
         if output_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"scraped_data_{timestamp}.csv"
-        
-        # Flatten data for CSV export
-        csv_data = self._flatten_for_csv(data)
+            output_file = self.default_output_file('csv')
         
-        if not csv_data:
-            # Create a simple CSV with basic info
-            csv_data = [{
-                'url': data.get('url', ''),
-                'timestamp': data.get('timestamp', ''),
-                'title': '',
-                'content': '',
-                'page_type': '',
-                'authors': '',
-                'keywords': ''
-            }]
+        rows = self._iter_export_rows(data)
+        if chunksize is None:
+            rows = list(rows)
+        first_row = next(iter(rows))
         
         # Write to CSV
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            if csv_data:
-                fieldnames = csv_data[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(csv_data)
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            # Every flattened row has the same keys, in the same order,
+            # so rows are written as plain value tuples
+            fieldnames = list(first_row)
+            get_values = itemgetter(*fieldnames)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            if chunksize is None:
+                writer.writerows(map(get_values, rows))
+            else:
+                # rows is a generator already past the first row
+                for chunk in _iter_chunks(chain((first_row,), rows), chunksize):
+                    writer.writerows(map(get_values, chunk))
         
         if self.logger:
             self.logger.info(f"Data exported to CSV: {output_file}")
@@ -127,25 +227,22 @@ class DataExporter:
             Path to the exported Excel file
         """
         if output_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = self.output_dir / f"scraped_data_{timestamp}.xlsx"
+            output_file = self.default_output_file('excel')
         
-        # Flatten data for Excel export
-        excel_data = self._flatten_for_csv(data)
+        if xlsxwriter is not None:
+            # Rows are flattened as they are written, never all at once
+            self._write_xlsx(output_file, self._iter_export_rows(data), data.get('metadata'))
+            if self.logger:
+                self.logger.info(f"Data exported to Excel: {output_file}")
+            return output_file
         
-        if not excel_data:
-            excel_data = [{
-                'url': data.get('url', ''),
-                'timestamp': data.get('timestamp', ''),
-                'title': '',
-                'content': '',
-                'page_type': '',
-                'authors': '',
-                'keywords': ''
-            }]
+        # pandas (and openpyxl) are only needed here, so import them lazily to
+        # keep them off the CLI startup path
+        import pandas as pd
         
-        # Create DataFrame and export to Excel
-        df = pd.DataFrame(excel_data)
+        # Create DataFrame (from columns, so no list of row dicts is kept)
+        # and export to Excel
+        df = pd.DataFrame(self._collect_columns(self._iter_export_rows(data)))
         
         with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
             df.to_excel(writer, sheet_name='Scraped Data', index=False)
@@ -160,14 +257,95 @@ class DataExporter:
         
         return output_file
     
-    def _prepare_for_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _export_parquet(self, data: Dict[str, Any], 
+                        output_file: Optional[Path] = None) -> Path:
+        """Export data as a zstd-compressed Parquet file.
+        
+        The table is built straight from the flattened rows with pyarrow,
+        without going through pandas.
+        
+        Args:
+            data: Data to export
+            output_file: Optional output file path
+            
+        Returns:
+            Path to the exported Parquet file
+        """
+        # pyarrow is heavy and only needed here (see the 'parquet' extra)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        if output_file is None:
+            output_file = self.default_output_file('parquet')
+        
+        columns = {}
+        for name, values in self._collect_columns(self._iter_export_rows(data)).items():
+            try:
+                columns[name] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed column, e.g. a status code that is '' on failed
+                # pages; store it as text like the CSV export does
+                columns[name] = pa.array([str(value) for value in values], type=pa.string())
+        
+        pq.write_table(pa.Table.from_pydict(columns), output_file, compression='zstd')
+        
+        if self.logger:
+            self.logger.info(f"Data exported to Parquet: {output_file}")
+        
+        return output_file
+    
+    @staticmethod
+    def _collect_columns(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """Gather rows that share the same keys into one list per column.
+
+        Rows are consumed one at a time, so a generator of rows is never held
+        in memory as a list of dicts.
+        """
+        rows = iter(rows)
+        first_row = next(rows)
+        columns = {name: [value] for name, value in first_row.items()}
+        appends = [column.append for column in columns.values()]
+        get_values = itemgetter(*columns)
+        for row in rows:
+            for append, value in zip(appends, get_values(row)):
+                append(value)
+        return columns
+    
+    def _write_xlsx(self, output_file: Path, rows: Iterable[Dict[str, Any]],
+                    metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Write rows (and an optional metadata sheet) with xlsxwriter.
+
+        In constant_memory mode each row is flushed to disk as soon as it
+        is written, instead of keeping the whole sheet in memory as pandas
+        and openpyxl do.
+        """
+        workbook = xlsxwriter.Workbook(str(output_file), {'constant_memory': True, 'strings_to_urls': False})
+        try:
+            rows = iter(rows)
+            first_row = next(rows)
+            fieldnames = list(first_row)
+            worksheet = workbook.add_worksheet('Scraped Data')
+            worksheet.write_row(0, 0, fieldnames)
+            get_values = itemgetter(*fieldnames)
+            for row_num, row in enumerate(chain((first_row,), rows), 1):
+                worksheet.write_row(row_num, 0, get_values(row))
+            
+            if metadata is not None:
+                metadata_sheet = workbook.add_worksheet('Metadata')
+                metadata_sheet.write_row(0, 0, list(metadata))
+                metadata_sheet.write_row(1, 0, list(metadata.values()))
+        finally:
+            workbook.close()
+    
+    def _prepare_for_json(self, data: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Iterator[Dict[str, Any]]]:
         """Prepare data for JSON export.
 
         Args:
             data: Raw data
 
         Returns:
-            Data prepared for JSON export
+            The document envelope, the key of its member/page list, and a
+            lazy iterator over the list's entries
         """
         json_data = {
             'export_info': {
@@ -183,111 +361,155 @@ class DataExporter:
         # Check if this is membership directory data
         if 'members' in data:
             json_data['scraping_info']['members_found'] = len(data.get('members', []))
-            json_data['members'] = []
+            return json_data, 'members', self._iter_json_members(data)
 
-            # Process each member
-            for member in data.get('members', []):
-                member_data = {
-                    'name': member.get('name', ''),
-                    'field': member.get('field', ''),
-                    'city': member.get('city', ''),
-                    'state': member.get('state', ''),
-                    'location': member.get('location', ''),
-                    'mailing_address': member.get('mailing_address', ''),
-                    'phone': member.get('phone', ''),
-                    'email': member.get('email', ''),
-                    'certified': member.get('certified', False),
-                    'detail_url': member.get('detail_url', ''),
-                    'about': member.get('about', ''),
-                    'social_media': member.get('social_media', []),
-                    'logo': member.get('logo', ''),
-                    'highlights': member.get('highlights', []),
-                    'photos': member.get('photos', [])
-                }
-                json_data['members'].append(member_data)
-        else:
-            # Handle legacy page data
-            json_data['scraping_info']['pages_found'] = len(data.get('data', []))
-            json_data['scraping_info']['depth'] = data.get('depth', 1)
-            json_data['pages'] = []
-
-            # Process each page
-            for page in data.get('data', []):
-                page_data = {
-                    'url': page.get('url', ''),
-                    'title': page.get('title', ''),
-                    'status_code': page.get('status_code', ''),
-                    'content_type': page.get('content_type', ''),
-                    'metadata': page.get('metadata', {}),
-                    'extracted_data': page.get('extracted_data', {}),
-                    'links_count': len(page.get('links', [])),
-                    'content_preview': self._get_content_preview(page.get('content', '')),
-                    'authors': page.get('extracted_data', {}).get('authors', []),
-                    'keywords': page.get('extracted_data', {}).get('keywords', [])
-                }
-                json_data['pages'].append(page_data)
+        # Handle legacy page data
+        json_data['scraping_info']['pages_found'] = len(data.get('data', []))
+        json_data['scraping_info']['depth'] = data.get('depth', 1)
+        return json_data, 'pages', self._iter_json_pages(data)
 
-        return json_data
-    
-    def _flatten_for_csv(self, data: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Flatten data for CSV export.
+    def _iter_json_members(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield each member prepared for JSON export."""
+        for member in data.get('members', []):
+            mget = member.get
+            yield {
+                'name': mget('name', ''),
+                'field': mget('field', ''),
+                'city': mget('city', ''),
+                'state': mget('state', ''),
+                'location': mget('location', ''),
+                'mailing_address': mget('mailing_address', ''),
+                'phone': mget('phone', ''),
+                'email': mget('email', ''),
+                'certified': mget('certified', False),
+                'detail_url': mget('detail_url', ''),
+                'about': mget('about', ''),
+                'social_media': mget('social_media', []),
+                'logo': mget('logo', ''),
+                'highlights': mget('highlights', []),
+                'photos': mget('photos', [])
+            }
 
-        Args:
-            data: Raw data
+    def _iter_json_pages(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield each legacy page prepared for JSON export."""
+        for page, extracted, _, content_preview, links_count in self._iter_page_views(data):
+            pget = page.get
+            eget = extracted.get
+            yield {
+                'url': pget('url', ''),
+                'title': pget('title', ''),
+                'status_code': pget('status_code', ''),
+                'content_type': pget('content_type', ''),
+                'metadata': pget('metadata', {}),
+                'extracted_data': extracted,
+                'links_count': links_count,
+                'content_preview': content_preview,
+                'authors': eget('authors', []),
+                'keywords': eget('keywords', [])
+            }
 
-        Returns:
-            List of flattened dictionaries
+    def _iter_page_views(self, data: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], int, str, int]]:
+        """Yield the values shared by the JSON and CSV views of each legacy page.
+
+        Each page's extracted data, content length, content preview and link
+        count are looked up or computed once, here, for whichever view is
+        built from them.
+
+        Yields:
+            ``(page, extracted, content_length, content_preview, links_count)``
         """
-        flattened = []
+        get_content_preview = self._get_content_preview
+        for page in data.get('data', []):
+            pget = page.get
+            content = pget('content', '')
+            yield (
+                page,
+                pget('extracted_data') or {},
+                len(content),
+                get_content_preview(content),
+                len(pget('links') or ()),
+            )
+    
+    def _iter_export_rows(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the flattened rows, or one placeholder row when there are none."""
+        empty = True
+        for row in self._iter_flat_rows(data):
+            empty = False
+            yield row
+        if empty:
+            yield {
+                'url': data.get('url', ''),
+                'timestamp': data.get('timestamp', ''),
+                'title': '',
+                'content': '',
+                'page_type': '',
+                'authors': '',
+                'keywords': ''
+            }
+
+    def _iter_flat_rows(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Lazily flatten data for CSV/Excel export, one row per member or page."""
+        timestamp = data.get('timestamp', '')
 
         # Check if this is membership directory data
         if 'members' in data:
             # Handle membership directory data
             for member in data.get('members', []):
+                mget = member.get
+                # Members read back from a CSV export are already flattened
+                social_media = mget('social_media') or ()
+                if not isinstance(social_media, str):
+                    social_media = '; '.join(f"{sm.get('platform', '')}: {sm.get('url', '')}" for sm in social_media)
+                highlights = mget('highlights') or ()
+                if not isinstance(highlights, str):
+                    highlights = '; '.join(highlights)
+                if 'photos_count' in member:
+                    photos_count = member['photos_count']
+                else:
+                    photos_count = len(mget('photos') or ())
+
                 flat_row = {
-                    'name': member.get('name', ''),
-                    'field': member.get('field', ''),
-                    'city': member.get('city', ''),
-                    'state': member.get('state', ''),
-                    'location': member.get('location', ''),
-                    'mailing_address': member.get('mailing_address', ''),
-                    'phone': member.get('phone', ''),
-                    'email': member.get('email', ''),
-                    'certified': 'Yes' if member.get('certified', False) else 'No',
-                    'detail_url': member.get('detail_url', ''),
-                    'about': member.get('about', ''),
-                    'social_media': '; '.join([f"{sm.get('platform', '')}: {sm.get('url', '')}" for sm in member.get('social_media', [])]),
-                    'logo': member.get('logo', ''),
-                    'highlights': '; '.join(member.get('highlights', [])),
-                    'photos_count': len(member.get('photos', [])),
-                    'timestamp': data.get('timestamp', '')
+                    'name': mget('name', ''),
+                    'field': mget('field', ''),
+                    'city': mget('city', ''),
+                    'state': mget('state', ''),
+                    'location': mget('location', ''),
+                    'mailing_address': mget('mailing_address', ''),
+                    'phone': mget('phone', ''),
+                    'email': mget('email', ''),
+                    'certified': 'Yes' if mget('certified', False) else 'No',
+                    'detail_url': mget('detail_url', ''),
+                    'about': mget('about', ''),
+                    'social_media': social_media,
+                    'logo': mget('logo', ''),
+                    'highlights': highlights,
+                    'photos_count': photos_count,
+                    'timestamp': timestamp
                 }
-                flattened.append(flat_row)
+                yield flat_row
         else:
             # Handle legacy page data
-            for page in data.get('data', []):
-                extracted = page.get('extracted_data', {})
-
+            for page, extracted, content_length, content_preview, links_count in self._iter_page_views(data):
+                pget = page.get
+                eget = extracted.get
                 flat_row = {
-                    'url': page.get('url', ''),
-                    'timestamp': data.get('timestamp', ''),
-                    'title': page.get('title', ''),
-                    'status_code': page.get('status_code', ''),
-                    'content_type': page.get('content_type', ''),
-                    'page_type': extracted.get('page_type', ''),
-                    'authors': '; '.join([a.get('name', '') for a in extracted.get('authors', [])]),
-                    'keywords': '; '.join(extracted.get('keywords', [])),
-                    'content_length': len(page.get('content', '')),
-                    'content_preview': self._get_content_preview(page.get('content', '')),
-                    'links_count': len(page.get('links', [])),
-                    'issue_number': extracted.get('issue_number', ''),
-                    'year': extracted.get('year', ''),
-                    'abstract': extracted.get('abstract', '')
+                    'url': pget('url', ''),
+                    'timestamp': timestamp,
+                    'title': pget('title', ''),
+                    'status_code': pget('status_code', ''),
+                    'content_type': pget('content_type', ''),
+                    'page_type': eget('page_type', ''),
+                    'authors': '; '.join(a.get('name', '') for a in eget('authors') or ()),
+                    'keywords': '; '.join(eget('keywords') or ()),
+                    'content_length': content_length,
+                    'content_preview': content_preview,
+                    'links_count': links_count,
+                    'issue_number': eget('issue_number', ''),
+                    'year': eget('year', ''),
+                    'abstract': eget('abstract', '')
                 }
 
-                flattened.append(flat_row)
-
-        return flattened
+                yield flat_row
     
     def _get_content_preview(self, content: str, max_length: int = 200) -> str:
         """Get a preview of the content.
@@ -302,8 +524,20 @@ class DataExporter:
         if not content:
             return ''
         
-        # Remove extra whitespace
-        content = ' '.join(content.split())
+        # Collapse whitespace in just enough of the content for the preview:
+        # a head about twice the preview length, doubled while whitespace
+        # runs shrink it too much
+        head_length = max_length * 2 + 2
+        while True:
+            preview = _WHITESPACE_RE.sub(' ', content[:head_length]).lstrip()
+            # The head may end with one space that the full text would strip
+            if len(preview) > max_length + 1:
+                return preview[:max_length] + '...'
+            if head_length >= len(content):
+                break
+            head_length *= 2
+        
+        content = preview.rstrip()
         
         if len(content) <= max_length:
             return content
@@ -324,7 +558,7 @@ class DataExporter:
         
         summary = self._generate_summary(data)
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
+        with open(summary_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(summary)
         
         if self.logger:
@@ -341,46 +575,51 @@ class DataExporter:
         Returns:
             Summary text
         """
-        summary_lines = []
-        summary_lines.append("SCRAPING SUMMARY")
-        summary_lines.append("=" * 50)
-        summary_lines.append(f"Source URL: {data.get('url', 'Unknown')}")
-        summary_lines.append(f"Scraping Depth: {data.get('depth', 1)}")
-        summary_lines.append(f"Timestamp: {datetime.fromtimestamp(data.get('timestamp', 0)).isoformat()}")
-        summary_lines.append("")
+        # One buffer written in a few multi-line chunks, instead of a list
+        # of lines joined at the end
+        buf = io.StringIO()
+        write = buf.write
         
         pages = data.get('data', [])
-        summary_lines.append(f"Pages Scraped: {len(pages)}")
-        summary_lines.append(f"Errors: {len(data.get('errors', []))}")
-        summary_lines.append("")
+        write(
+            "SCRAPING SUMMARY\n"
+            f"{'=' * 50}\n"
+            f"Source URL: {data.get('url', 'Unknown')}\n"
+            f"Scraping Depth: {data.get('depth', 1)}\n"
+            f"Timestamp: {datetime.fromtimestamp(data.get('timestamp', 0)).isoformat()}\n"
+            "\n"
+            f"Pages Scraped: {len(pages)}\n"
+            f"Errors: {len(data.get('errors', []))}\n"
+            "\n"
+        )
         
         if pages:
-            summary_lines.append("PAGE DETAILS:")
-            summary_lines.append("-" * 30)
+            write(f"PAGE DETAILS:\n{'-' * 30}\n")
             
             for i, page in enumerate(pages, 1):
                 extracted = page.get('extracted_data', {})
-                summary_lines.append(f"{i}. {page.get('title', 'No title')}")
-                summary_lines.append(f"   URL: {page.get('url', 'No URL')}")
-                summary_lines.append(f"   Type: {extracted.get('page_type', 'Unknown')}")
-                summary_lines.append(f"   Status: {page.get('status_code', 'N/A')}")
-                summary_lines.append(f"   Content Length: {len(page.get('content', ''))}")
+                write(
+                    f"{i}. {page.get('title', 'No title')}\n"
+                    f"   URL: {page.get('url', 'No URL')}\n"
+                    f"   Type: {extracted.get('page_type', 'Unknown')}\n"
+                    f"   Status: {page.get('status_code', 'N/A')}\n"
+                    f"   Content Length: {len(page.get('content', ''))}\n"
+                )
                 
                 authors = extracted.get('authors', [])
                 if authors:
                     author_names = [a.get('name', '') for a in authors[:3]]  # Limit to first 3
-                    summary_lines.append(f"   Authors: {', '.join(author_names)}")
+                    write(f"   Authors: {', '.join(author_names)}\n")
                 
-                summary_lines.append("")
+                write("\n")
         
         if data.get('errors'):
-            summary_lines.append("ERRORS:")
-            summary_lines.append("-" * 30)
+            write(f"ERRORS:\n{'-' * 30}\n")
             for error in data.get('errors', []):
-                summary_lines.append(f"- {error}")
-            summary_lines.append("")
+                write(f"- {error}\n")
+            write("\n")
         
-        summary_lines.append("=" * 50)
-        summary_lines.append(f"Generated by scraper-classicist-org on {datetime.now().isoformat()}")
+        write(f"{'=' * 50}\n")
+        write(f"Generated by scraper-classicist-org on {datetime.now().isoformat()}")
         
-        return '\n'.join(summary_lines)
\ No newline at end of file
+        return buf.getvalue()
\ No newline at end of file
@@ -1,9 +1,150 @@
 """HTML parsing and data extraction utilities for classicist.org."""
 
+import functools
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Union
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # optional, see the 'fast' extra
+    lxml = None
+
+
+# bs4 tree builder: the C-backed lxml parser when available
+_PARSER_FEATURES = 'lxml' if lxml is not None else 'html.parser'
+
+
+# Only the tags extract_links() reads; everything else is skipped at parse time
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# urljoin() re-parses both URLs on every call; pages repeat the same
+# navigation links, so memoise per (base, href) pair
+_resolve_url = functools.lru_cache(maxsize=8192)(urljoin)
+
+if lxml is not None:
+    # Raw-HTML link extraction straight on lxml, skipping the bs4 wrappers.
+    # An anchor's text leaves out <script>, <style> and <template> inside it,
+    # like get_text(); $depth is the anchor's own number of ancestors.
+    _ANCHOR_XPATH = etree.XPath('//a[@href]')
+    _ANCHOR_DEPTH_XPATH = etree.XPath('count(ancestor::*)')
+    _ANCHOR_TEXT_XPATH = etree.XPath(
+        './/text()[not(ancestor::*[self::script or self::style or self::template]'
+        '[count(ancestor::*) > $depth])]'
+    )
+
+
+# Selectors simple enough to run through find() instead of soupsieve:
+# "tag", ".class", "#id", "tag[attr]" and tag[attr="value"]
+_SIMPLE_SELECTOR_RE = re.compile(
+    r'^(?:(?P<tag>[a-z][a-z0-9]*)(?:\[(?P<attr>[\w:-]+)(?:="(?P<value>[^"]*)")?\])?'
+    r'|\.(?P<class_>[\w-]+)|#(?P<id>[\w-]+))$'
+)
+
+# Metadata selectors, most specific first
+_AUTHOR_SELECTORS = (
+    'meta[name="author"]',
+    'meta[property="article:author"]',
+    '.author',
+    '.byline',
+    '[class*="author"]'
+)
+_DATE_SELECTORS = (
+    'meta[property="article:published_time"]',
+    'meta[name="date"]',
+    'time[datetime]',
+    '.date',
+    '.published',
+    '[class*="date"]'
+)
+
+# Page-type specific selectors used by DataExtractor
+_TITLE_SELECTORS = ('h1', '.entry-title', '.post-title', 'title')
+_ABSTRACT_SELECTORS = ('.abstract', '.summary', '.excerpt', '[class*="abstract"]')
+_ISSUE_SELECTORS = ('.issue-title', '.issue-number', 'h1', 'title')
+
+
+# Patterns for classicist.org specific content, compiled once at import
+_ARTICLE_RES = (
+    re.compile(r'ISSUE\s+\d+'),
+    re.compile(r'Volume\s+\d+'),
+    re.compile(r'Classical\s+\w+'),
+    re.compile(r'Ancient\s+\w+')
+)
+_AUTHOR_RES = (
+    re.compile(r'by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'),
+    re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+Ph\.?D\.?'),
+    re.compile(r'Prof\.?\s+([A-Z][a-z]+\s+[A-Z][a-z]+)')
+)
+_ISSUE_RE = re.compile(r'(?:issue|volume)\s+(\d+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(\d{4})')
+_KEYWORD_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b')
+_ARTICLE_HREF_RE = re.compile(r'/article/|/post/')
+_ISSUE_HREF_RE = re.compile(r'/issue/|/issues/')
+
+# Capitalized words that are never keywords
+_COMMON_WORDS = frozenset({'The', 'And', 'For', 'With', 'That', 'This', 'From', 'Have', 'Not', 'But', 'You'})
+
+# Most keywords kept per page
+_MAX_KEYWORDS = 20
+
+
+def _selector_finder(selector: str):
+    """Return a function that finds the first element matching ``selector``.
+    
+    Simple selectors become a plain find() call; anything else is
+    compiled by soupsieve here, once. Either way no CSS is parsed per
+    lookup.
+    """
+    match = _SIMPLE_SELECTOR_RE.match(selector)
+    if match is None:
+        compiled = sv.compile(selector)
+        return compiled.select_one
+    
+    tag, attr, value, class_, id_ = match.group('tag', 'attr', 'value', 'class_', 'id')
+    if class_:
+        return lambda soup: soup.find(class_=class_)
+    if id_:
+        return lambda soup: soup.find(id=id_)
+    if attr:
+        attrs = {attr: True if value is None else value}
+        return lambda soup: soup.find(tag, attrs=attrs)
+    return lambda soup: soup.find(tag)
+
+
+def _selector_finders(selectors) -> List:
+    """Classify each selector once; see _selector_finder()."""
+    return [_selector_finder(selector) for selector in selectors]
+
+
+_AUTHOR_FINDERS = _selector_finders(_AUTHOR_SELECTORS)
+_DATE_FINDERS = _selector_finders(_DATE_SELECTORS)
+_TITLE_FINDERS = _selector_finders(_TITLE_SELECTORS)
+_ABSTRACT_FINDERS = _selector_finders(_ABSTRACT_SELECTORS)
+_ISSUE_FINDERS = _selector_finders(_ISSUE_SELECTORS)
+
+
+# Block-level tags considered by the largest-text-block fallback
+_TEXT_BLOCK_TAGS = ['p', 'div', 'section', 'article']
+
+# String types that get_text() includes (comments, doctypes etc. are skipped)
+_TEXT_STRING_TYPES = (NavigableString, CData)
+
+
+def parse_html(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse raw HTML into a BeautifulSoup tree.
+    
+    Args:
+        html: Raw HTML
+        parse_only: Optional strainer; only matching tags are built
+        
+    Returns:
+        BeautifulSoup object
+    """
+    return BeautifulSoup(html, _PARSER_FEATURES, parse_only=parse_only)
 
 
 class HTMLParser:
@@ -30,6 +171,8 @@ class HTMLParser:
             'ul[class*="nav"]',
             'div[class*="menu"]'
         ]
+        
+        self._content_finders = _selector_finders(self.content_selectors)
     
     def extract_main_content(self, soup: BeautifulSoup) -> str:
         """Extract the main content from a page.
@@ -41,8 +184,8 @@ class HTMLParser:
             Main content as text
         """
         # Try each selector until we find content
-        for selector in self.content_selectors:
-            element = soup.select_one(selector)
+        for find in self._content_finders:
+            element = find(soup)
             if element:
                 # Clean up the content
                 for tag in element.find_all(['script', 'style', 'nav', 'footer']):
@@ -65,18 +208,30 @@ class HTMLParser:
         for tag in soup.find_all(['script', 'style']):
             tag.decompose()
         
-        # Find all text-containing elements
-        elements = []
-        for tag in soup.find_all(['p', 'div', 'section', 'article']):
-            text = tag.get_text(strip=True)
-            if len(text) > 100:  # Only consider substantial text blocks
-                elements.append((tag, len(text)))
-        
-        if not elements:
+        # Length of every element's get_text(strip=True), computed bottom-up
+        # in one pass: reverse document order reaches children before their
+        # parents, so nested blocks' text is never rebuilt per candidate
+        text_lengths = {}
+        for node in reversed(list(soup.descendants)):
+            if isinstance(node, Tag):
+                text_lengths[id(node)] = sum(text_lengths.get(id(child), 0) for child in node.contents)
+            elif type(node) in _TEXT_STRING_TYPES:
+                text_lengths[id(node)] = len(node.strip())
+        
+        # Find the largest substantial (over 100 characters) text block; the
+        # first one wins a tie
+        largest = None
+        largest_length = 100
+        for tag in soup.find_all(_TEXT_BLOCK_TAGS):
+            length = text_lengths[id(tag)]
+            if length > largest_length:
+                largest = tag
+                largest_length = length
+        
+        if largest is None:
             return soup.get_text(separator='\n', strip=True)
         
         # Return the largest text block
-        largest = max(elements, key=lambda x: x[1])[0]
         return largest.get_text(separator='\n', strip=True)
     
     def extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
@@ -103,16 +258,8 @@ class HTMLParser:
                 metadata[name] = content
         
         # Author
-        author_selectors = [
-            'meta[name="author"]',
-            'meta[property="article:author"]',
-            '.author',
-            '.byline',
-            '[class*="author"]'
-        ]
-        
-        for selector in author_selectors:
-            element = soup.select_one(selector)
+        for find in _AUTHOR_FINDERS:
+            element = find(soup)
             if element:
                 if element.name == 'meta':
                     metadata['author'] = element.get('content', '').strip()
@@ -121,17 +268,8 @@ class HTMLParser:
                 break
         
         # Publication date
-        date_selectors = [
-            'meta[property="article:published_time"]',
-            'meta[name="date"]',
-            'time[datetime]',
-            '.date',
-            '.published',
-            '[class*="date"]'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
+        for find in _DATE_FINDERS:
+            element = find(soup)
             if element:
                 if element.name == 'meta':
                     metadata['date'] = element.get('content', '').strip()
@@ -141,56 +279,110 @@ class HTMLParser:
         
         return metadata
     
-    def extract_links(self, soup: BeautifulSoup, base_url: str = "") -> List[Dict[str, str]]:
+    def extract_links(self, soup: Union[BeautifulSoup, str], base_url: str = "") -> List[Dict[str, str]]:
         """Extract all links from the page.
         
         Args:
-            soup: BeautifulSoup object
+            soup: BeautifulSoup object, or raw HTML to parse for links only
             base_url: Base URL for resolving relative links
             
         Returns:
             List of dictionaries with link information
         """
-        links = []
+        return list(iter_links(self.extract_link_columns(soup, base_url)))
+    
+    def extract_link_columns(self, soup: Union[BeautifulSoup, str], base_url: str = "") -> Dict[str, List[str]]:
+        """Extract all links from the page as parallel lists.
         
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            text = a_tag.get_text(strip=True)
-            title = a_tag.get('title', '')
+        Same data as extract_links(), but as one list per field instead of
+        a dict per link, which is much lighter on pages with many links.
+        
+        Args:
+            soup: BeautifulSoup object, or raw HTML to parse for links only
+            base_url: Base URL for resolving relative links
             
-            # Resolve relative URLs
-            if base_url:
-                full_url = urljoin(base_url, href)
-            else:
-                full_url = href
+        Returns:
+            ``{'url': [...], 'text': [...], 'title': [...]}``, index-aligned
+        """
+        if isinstance(soup, str):
+            if lxml is not None:
+                columns = _lxml_link_columns(soup)
+                if columns is not None:
+                    return _resolve_link_columns(*columns, base_url)
             
-            links.append({
-                'url': full_url,
-                'text': text,
-                'title': title
-            })
-        
-        return links
+            # Build only the <a href> tags instead of the whole document
+            soup = parse_html(soup, _LINK_STRAINER)
+        
+        # One comprehension per column instead of three append() calls per link
+        anchors = soup.find_all('a', href=True)
+        urls = [a_tag['href'] for a_tag in anchors]
+        texts = [a_tag.get_text(strip=True) for a_tag in anchors]
+        titles = [a_tag.get('title', '') for a_tag in anchors]
+        return _resolve_link_columns(urls, texts, titles, base_url)
+
+
+def _lxml_link_columns(html: str) -> Optional[tuple]:
+    """Read the ``(urls, texts, titles)`` of raw HTML's <a href> tags with lxml.
+    
+    Gives the same columns as parsing with bs4 and _LINK_STRAINER, a few
+    times faster. Returns None for input lxml.html rejects (empty documents,
+    str with an XML encoding declaration), so the caller can fall back.
+    """
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+    
+    anchors = _ANCHOR_XPATH(doc)
+    depth = _ANCHOR_DEPTH_XPATH
+    text = _ANCHOR_TEXT_XPATH
+    urls = [a_tag.get('href') for a_tag in anchors]
+    texts = [''.join([s.strip() for s in text(a_tag, depth=depth(a_tag))]) for a_tag in anchors]
+    titles = [a_tag.get('title', '') for a_tag in anchors]
+    return urls, texts, titles
+
+
+def _resolve_link_columns(urls: List[str], texts: List[str], titles: List[str],
+                          base_url: str) -> Dict[str, List[str]]:
+    """Assemble link columns, resolving relative URLs against ``base_url`` if given."""
+    if base_url:
+        resolve = _resolve_url
+        urls = [resolve(base_url, href) for href in urls]
+    
+    return {'url': urls, 'text': texts, 'title': titles}
+
+
+def iter_links(columns: Dict[str, List[str]]) -> Iterator[Dict[str, str]]:
+    """Yield the links in HTMLParser.extract_link_columns() output as dicts.
+    
+    Args:
+        columns: ``{'url': [...], 'text': [...], 'title': [...]}``
+        
+    Yields:
+        ``{'url': ..., 'text': ..., 'title': ...}`` per link
+    """
+    for url, text, title in zip(columns['url'], columns['text'], columns['title']):
+        yield {'url': url, 'text': text, 'title': title}
+
+
+# Shared by DataExtractor instances that are not given a parser
+_DEFAULT_HTML_PARSER = HTMLParser()
 
 
 class DataExtractor:
     """Specialized data extractor for classicist.org content."""
     
-    def __init__(self):
-        """Initialize the data extractor."""
-        # Patterns for classicist.org specific content
-        self.article_patterns = [
-            r'ISSUE\s+\d+',
-            r'Volume\s+\d+',
-            r'Classical\s+\w+',
-            r'Ancient\s+\w+'
-        ]
+    def __init__(self, html_parser: Optional[HTMLParser] = None):
+        """Initialize the data extractor.
         
-        self.author_patterns = [
-            r'by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+Ph\.?D\.?',
-            r'Prof\.?\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'
-        ]
+        Args:
+            html_parser: HTMLParser used for article content (default: a
+                shared module-level instance)
+        """
+        self.html_parser = html_parser if html_parser is not None else _DEFAULT_HTML_PARSER
+        # Patterns for classicist.org specific content (precompiled)
+        self.article_patterns = list(_ARTICLE_RES)
+        self.author_patterns = list(_AUTHOR_RES)
     
     def extract_data(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract structured data based on page type.
@@ -203,7 +395,7 @@ class DataExtractor:
             Dictionary of extracted data
         """
         data = {
-            'page_type': self._determine_page_type(soup, url),
+            'page_type': self._determine_page_type(url),
             'articles': [],
             'issues': [],
             'authors': [],
@@ -218,17 +410,22 @@ class DataExtractor:
         elif data['page_type'] == 'archive':
             data.update(self._extract_archive_data(soup))
         
-        # Extract common elements
-        data['keywords'] = self._extract_keywords(soup)
-        data['authors'] = self._extract_authors(soup)
+        # Extract common elements from one copy of the page text, taken
+        # after the page-type extractors have stripped scripts and styles
+        page_text = soup.get_text()
+        data['keywords'] = self._extract_keywords(soup, page_text)
+        data['authors'] = self._extract_authors(soup, page_text)
         
         return data
     
-    def _determine_page_type(self, soup: BeautifulSoup, url: str) -> str:
-        """Determine the type of page based on URL and content.
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _determine_page_type(url: str) -> str:
+        """Determine the type of page based on its URL.
+        
+        Cached, since crawls keep classifying the same URLs.
         
         Args:
-            soup: BeautifulSoup object
             url: Page URL
             
         Returns:
@@ -252,24 +449,21 @@ class DataExtractor:
         article_data = {}
         
         # Article title (try different selectors)
-        title_selectors = ['h1', '.entry-title', '.post-title', 'title']
-        for selector in title_selectors:
-            element = soup.select_one(selector)
+        for find in _TITLE_FINDERS:
+            element = find(soup)
             if element:
                 article_data['title'] = element.get_text().strip()
                 break
         
         # Abstract or summary
-        abstract_selectors = ['.abstract', '.summary', '.excerpt', '[class*="abstract"]']
-        for selector in abstract_selectors:
-            element = soup.select_one(selector)
+        for find in _ABSTRACT_FINDERS:
+            element = find(soup)
             if element:
                 article_data['abstract'] = element.get_text().strip()
                 break
         
         # Main content
-        parser = HTMLParser()
-        article_data['content'] = parser.extract_main_content(soup)
+        article_data['content'] = self.html_parser.extract_main_content(soup)
         
         return article_data
     
@@ -278,24 +472,17 @@ class DataExtractor:
         issue_data = {}
         
         # Issue number and date
-        issue_selectors = [
-            '.issue-title',
-            '.issue-number',
-            'h1',
-            'title'
-        ]
-        
-        for selector in issue_selectors:
-            element = soup.select_one(selector)
+        for find in _ISSUE_FINDERS:
+            element = find(soup)
             if element:
                 text = element.get_text().strip()
                 # Try to extract issue number
-                issue_match = re.search(r'(?:issue|volume)\s+(\d+)', text, re.IGNORECASE)
+                issue_match = _ISSUE_RE.search(text)
                 if issue_match:
                     issue_data['issue_number'] = issue_match.group(1)
                 
                 # Try to extract date
-                date_match = re.search(r'(\d{4})', text)
+                date_match = _YEAR_RE.search(text)
                 if date_match:
                     issue_data['year'] = date_match.group(1)
                 
@@ -303,7 +490,7 @@ class DataExtractor:
                 break
         
         # Extract articles in this issue
-        article_links = soup.find_all('a', href=re.compile(r'/article/|/post/'))
+        article_links = soup.find_all('a', href=_ARTICLE_HREF_RE)
         articles = []
         for link in article_links:
             articles.append({
@@ -320,15 +507,15 @@ class DataExtractor:
         archive_data = {}
         
         # Extract issue links
-        issue_links = soup.find_all('a', href=re.compile(r'/issue/|/issues/'))
+        issue_links = soup.find_all('a', href=_ISSUE_HREF_RE)
         issues = []
         for link in issue_links:
             title = link.get_text().strip()
             url = link.get('href', '')
             
             # Try to extract issue number and year from title
-            issue_match = re.search(r'(?:issue|volume)\s+(\d+)', title, re.IGNORECASE)
-            year_match = re.search(r'(\d{4})', title)
+            issue_match = _ISSUE_RE.search(title)
+            year_match = _YEAR_RE.search(title)
             
             issues.append({
                 'title': title,
@@ -341,57 +528,72 @@ class DataExtractor:
         
         return archive_data
     
-    def _extract_keywords(self, soup: BeautifulSoup) -> List[str]:
-        """Extract keywords from the page."""
+    def _extract_keywords(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> List[str]:
+        """Extract up to _MAX_KEYWORDS unique keywords from the page.
+        
+        ``page_text`` is ``soup.get_text()``, when the caller already has it.
+        """
         keywords = []
+        seen = set()
         
         # From meta tags
         meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
         if meta_keywords:
             content = meta_keywords.get('content', '')
-            keywords.extend([k.strip() for k in content.split(',') if k.strip()])
-        
-        # From content - look for capitalized terms that might be keywords
-        content = soup.get_text()
-        words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b', content)
-        
-        # Filter common words and duplicates
-        common_words = {'The', 'And', 'For', 'With', 'That', 'This', 'From', 'Have', 'Not', 'But', 'You'}
-        keywords.extend([word for word in words if word not in common_words and len(word) > 3])
-        
-        # Remove duplicates and limit to reasonable number
-        unique_keywords = list(dict.fromkeys(keywords))[:20]
-        
-        return unique_keywords
+            for keyword in content.split(','):
+                keyword = keyword.strip()
+                if keyword and keyword not in seen:
+                    seen.add(keyword)
+                    keywords.append(keyword)
+                    if len(keywords) == _MAX_KEYWORDS:
+                        return keywords
+        
+        # From content - look for capitalized terms that might be keywords,
+        # filtering common words and duplicates as they are found and
+        # stopping as soon as there are enough
+        if page_text is None:
+            page_text = soup.get_text()
+        for match in _KEYWORD_RE.finditer(page_text):
+            word = match.group()
+            if len(word) > 3 and word not in _COMMON_WORDS and word not in seen:
+                seen.add(word)
+                keywords.append(word)
+                if len(keywords) == _MAX_KEYWORDS:
+                    break
+        
+        return keywords
     
-    def _extract_authors(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Extract author information from the page."""
+    def _extract_authors(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> List[Dict[str, str]]:
+        """Extract author information from the page.
+        
+        ``page_text`` is ``soup.get_text()``, when the caller already has it.
+        """
+        # Duplicates (case-insensitive) are skipped as they are found
         authors = []
+        seen = set()
         
         # From meta tags
         meta_author = soup.find('meta', attrs={'name': 'author'})
         if meta_author:
+            name = meta_author.get('content', '').strip()
+            seen.add(name.lower())
             authors.append({
-                'name': meta_author.get('content', '').strip(),
+                'name': name,
                 'type': 'meta'
             })
         
         # From content patterns
-        content = soup.get_text()
+        if page_text is None:
+            page_text = soup.get_text()
         for pattern in self.author_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                authors.append({
-                    'name': match.strip(),
-                    'type': 'extracted'
-                })
-        
-        # Remove duplicates
-        unique_authors = []
-        seen = set()
-        for author in authors:
-            if author['name'].lower() not in seen:
-                seen.add(author['name'].lower())
-                unique_authors.append(author)
-        
-        return unique_authors
\ No newline at end of file
+            for match in pattern.findall(page_text):
+                name = match.strip()
+                key = name.lower()
+                if key not in seen:
+                    seen.add(key)
+                    authors.append({
+                        'name': name,
+                        'type': 'extracted'
+                    })
+        
+        return authors
\ No newline at end of file
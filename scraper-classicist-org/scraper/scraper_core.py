@@ -1,24 +1,261 @@
 """Core scraping functionality for classicist.org using Playwright."""
 
 import asyncio
+import random
 import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 from urllib.parse import urljoin, urlparse
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
 from .parsers import HTMLParser, DataExtractor
 
 
+# In-page extraction scripts. The member detail extractor is installed on
+# the browser context once (see ClassicistScraper.initialize) because it runs
+# on every member page; the others run once per scrape.
+
+# Basic member info from the .list-item elements ``start`` to ``end`` on the
+# directory page, plus the total number of list items
+_DIRECTORY_MEMBERS_JS = """
+([start, end]) => {
+    const members = [];
+
+    // Look for member listing elements - based on actual page structure
+    const memberElements = document.querySelectorAll('.list-item');
+    const stop = Math.min(end, memberElements.length);
+
+    for (let i = start; i < stop; i++) {
+        const element = memberElements[i];
+        const member = {};
+
+        // Extract name from list-item-title-name
+        const nameElement = element.querySelector('.list-item-title-name a');
+        if (nameElement) {
+            member.name = nameElement.textContent.trim();
+            member.detail_url = nameElement.href;
+        }
+
+        // Extract field/classification from data attributes or text
+        const dataTitle = element.getAttribute('data-title');
+        if (dataTitle) {
+            member.data_title = dataTitle;
+        }
+
+        // Check for certified status - look for certified span
+        const certifiedElement = element.querySelector('.certified');
+        member.certified = certifiedElement !== null;
+
+        // Extract profession, chapter and level from the classes
+        // (profession-XXXX, chapter-XXXX, level-XXXX) in one pass; the
+        // first class with each prefix wins
+        for (const cls of element.classList) {
+            if (cls.startsWith('profession-')) {
+                if (member.profession_id === undefined) member.profession_id = cls.slice(11);
+            } else if (cls.startsWith('chapter-')) {
+                if (member.chapter_id === undefined) member.chapter_id = cls.slice(8);
+            } else if (cls.startsWith('level-')) {
+                if (member.level_id === undefined) member.level_id = cls.slice(6);
+            }
+        }
+
+        // Only add if we found at least a name
+        if (member.name) {
+            members.push(member);
+        }
+    }
+
+    return {members: members, total: memberElements.length};
+}
+"""
+
+# About text, social links, photos, logo and highlights of a member page,
+# read from ``doc`` (the current document by default)
+_MEMBER_DETAIL_EXTRACTOR_JS = """
+(doc = document) => {
+    const data = {
+        about: '',
+        social_media: [],
+        photos: [],
+        logo: '',
+        highlights: []
+    };
+
+    // Extract about section
+    const aboutElement = doc.querySelector('.about, .description, .bio, [class*="about"], [class*="bio"]');
+    if (aboutElement) {
+        data.about = aboutElement.textContent.trim();
+    }
+
+    // Extract social media links
+    const socialLinks = doc.querySelectorAll('a[href*="facebook"], a[href*="twitter"], a[href*="linkedin"], a[href*="instagram"], a[href*="youtube"]');
+    // One scan of each href instead of up to five includes() calls
+    const platformRe = /facebook|twitter|linkedin|instagram|youtube/;
+    socialLinks.forEach(link => {
+        const href = link.href;
+        const platform = href.match(platformRe);
+        data.social_media.push({
+            platform: platform ? platform[0] : 'other',
+            url: href,
+            text: link.textContent.trim()
+        });
+    });
+
+    // Extract photos
+    const photoElements = doc.querySelectorAll('img[src*="photo"], img[src*="image"], .photo, .image');
+    photoElements.forEach(img => {
+        if (img.src && !img.src.includes('logo')) {
+            data.photos.push({
+                url: img.src,
+                alt: img.alt || ''
+            });
+        }
+    });
+
+    // Extract logo
+    const logoElement = doc.querySelector('img[src*="logo"], .logo img, [class*="logo"] img');
+    if (logoElement && logoElement.src) {
+        data.logo = logoElement.src;
+    }
+
+    // Extract highlights
+    const highlightElements = doc.querySelectorAll('.highlight, .achievement, .award, [class*="highlight"]');
+    highlightElements.forEach(element => {
+        const highlight = element.textContent.trim();
+        if (highlight) {
+            data.highlights.push(highlight);
+        }
+    });
+
+    return data;
+}
+"""
+
+_MEMBER_DETAIL_JS = f"window.__extractMemberDetail = {_MEMBER_DETAIL_EXTRACTOR_JS};"
+
+# Runs the member detail extractor on downloaded HTML, without navigating.
+# Returns null when the page lacks the ready selector, i.e. it probably
+# renders its content with JavaScript and must be loaded for real.
+_MEMBER_DETAIL_FROM_HTML_JS = """
+([html, url, readySelector]) => {
+    const doc = new DOMParser().parseFromString(html, 'text/html');
+
+    // Resolve relative src/href against the member page, not this page
+    const base = doc.createElement('base');
+    base.href = url;
+    doc.head.prepend(base);
+
+    if (!doc.querySelector(readySelector)) {
+        return null;
+    }
+    return (""" + _MEMBER_DETAIL_EXTRACTOR_JS + """)(doc);
+}
+"""
+
+# Present on member pages whose details are in the served HTML
+_MEMBER_DETAIL_READY = '.about, .description, .bio, [class*="about"], [class*="bio"]'
+
+# Title, visible text and links of any page
+_PAGE_CONTENT_JS = """
+() => {
+    return {
+        url: window.location.href,
+        title: document.title,
+        content: document.body.innerText,
+        links: Array.from(document.querySelectorAll('a')).map(a => ({
+            text: a.textContent.trim(),
+            url: a.href
+        }))
+    };
+}
+"""
+
+# Chromium flags for running in containers and CI
+_LAUNCH_ARGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run'
+)
+# Only used headless: a visible browser keeps its zygote (fast renderer
+# startup) and GPU compositing
+_HEADLESS_LAUNCH_ARGS = (
+    '--no-zygote',
+    '--disable-gpu'
+)
+
+# Sub-resources the extractors never need. Image URLs are still read from
+# the src attributes when the images themselves are not downloaded.
+# Stylesheets are not on the list: innerText (and screenshots) depend on them.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Responses worth running the HTML extractors on
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+
+class _PageTooLarge(Exception):
+    """Raised by ClassicistScraper._fetch_html() for pages over MAX_HTML_BYTES."""
+
+
+def _content_type(headers: Dict[str, str]) -> str:
+    """Media type of a response, without parameters, from its (lowercase) headers."""
+    return headers.get('content-type', '').split(';', 1)[0].strip().lower()
+
+
+class RateLimiter:
+    """Async rate limiter allowing ``rate`` acquisitions per ``period`` seconds.
+
+    Acquisitions are spaced evenly, so concurrent workers stay polite
+    without being serialized behind a fixed sleep. Must be created while
+    the event loop is running.
+    """
+
+    def __init__(self, rate: int, period: float, jitter: float = 0.0):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Number of acquisitions allowed per period
+            period: Length of the period in seconds
+            jitter: Random extra spacing per acquisition, as a fraction of
+                the interval (0 keeps the spacing exact)
+        """
+        self.interval = period / rate if rate > 0 else 0.0
+        self.jitter = jitter
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = self._next_slot
+            self._next_slot = now + self.interval * (1 + random.uniform(0, self.jitter))
+
+
 class ClassicistScraper:
     """Main scraper class for classicist.org using Playwright."""
 
+    # Most member detail results kept by scrape_member_details()
+    DETAIL_CACHE_SIZE = 10000
+
+    # Largest page _fetch_html() downloads; bigger pages are skipped
+    MAX_HTML_BYTES = 5 * 1024 * 1024
+
     def __init__(self,
                  delay: float = 2.0,
                  timeout: int = 30000,  # 30 seconds in ms
                  headless: bool = True,
                  logger=None,
-                 output_dir: Optional[Path] = None):
+                 output_dir: Optional[Path] = None,
+                 max_pages: int = 5,
+                 block_resources: bool = True,
+                 block_stylesheets: bool = False):
         """Initialize the scraper.
 
         Args:
@@ -27,19 +264,35 @@ class ClassicistScraper:
             headless: Whether to run browser in headless mode
             logger: Logger instance
             output_dir: Directory for debug output
+            max_pages: Most pages kept open in the page pool
+            block_resources: Skip downloading BLOCKED_RESOURCE_TYPES; the
+                extractors only read the DOM, so this is on by default
+            block_stylesheets: Skip stylesheets too. Faster, but page text
+                then ignores CSS (hidden elements, layout line breaks)
         """
         self.delay = delay
         self.timeout = timeout
         self.headless = headless
         self.logger = logger
         self.output_dir = Path(output_dir) if output_dir else Path("./outputs")
+        self.max_pages = max_pages
+        self._block_resources = block_resources
+        self._block_stylesheets = block_stylesheets
 
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
 
+        # Reusable pages, opened on demand by acquire_page()
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._page_slots: Optional[asyncio.Semaphore] = None
+        self._pages: List[Page] = []
+
+        # Member details already scraped, oldest first
+        self._detail_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
         # Initialize components
         self.html_parser = HTMLParser()
-        self.data_extractor = DataExtractor()
+        self.data_extractor = DataExtractor(html_parser=self.html_parser)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -57,29 +310,30 @@ class ClassicistScraper:
 
         self.playwright = await async_playwright().start()
 
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-first-run',
-                '--no-zygote',
-                '--disable-gpu'
-            ]
-        )
+        args = list(_LAUNCH_ARGS)
+        if self.headless:
+            args += _HEADLESS_LAUNCH_ARGS
+        self.browser = await self.playwright.chromium.launch(headless=self.headless, args=args)
 
         self.context = await self.browser.new_context(
             user_agent='scraper-classicist-org/0.1.0 (Educational Purpose)',
             viewport={'width': 1920, 'height': 1080}
         )
+        await self.context.add_init_script(script=_MEMBER_DETAIL_JS)
+        if self._block_resources:
+            resource_types = BLOCKED_RESOURCE_TYPES
+            if self._block_stylesheets:
+                resource_types = resource_types | {'stylesheet'}
+            await self.block_resources(resource_types)
 
         if self.logger:
             self.logger.info("Browser initialized successfully")
 
     async def close(self):
         """Close browser and cleanup."""
+        self._page_pool = None
+        self._page_slots = None
+        self._pages = []
         if self.context:
             await self.context.close()
         if self.browser:
@@ -90,6 +344,62 @@ class ClassicistScraper:
         if self.logger:
             self.logger.info("Browser closed")
 
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[Page]:
+        """Borrow a page from the pool for the duration of the block.
+
+        Pages are opened lazily, up to ``max_pages``; after that callers wait
+        for a page to be returned. Returned pages that navigated are reset to
+        about:blank so the previous document is dropped before reuse.
+        """
+        if not self.context:
+            raise RuntimeError("Browser context not initialized")
+        if self._page_pool is None:
+            self._page_pool = asyncio.Queue()
+            self._page_slots = asyncio.Semaphore(self.max_pages)
+
+        pool = self._page_pool
+        # A slot is held for the whole borrow, so at most max_pages callers
+        # get past here; one that finds no idle page opens the next one
+        async with self._page_slots:
+            if pool.empty():
+                page = await self.context.new_page()
+                page.set_default_timeout(self.timeout)
+                self._pages.append(page)
+            else:
+                page = pool.get_nowait()
+
+            try:
+                yield page
+            finally:
+                if page.url != 'about:blank':
+                    try:
+                        await page.goto('about:blank')
+                    except Exception as e:
+                        if self.logger:
+                            self.logger.debug(f"Failed to reset page: {e}")
+                pool.put_nowait(page)
+
+    async def block_resources(self, resource_types=BLOCKED_RESOURCE_TYPES) -> None:
+        """Abort requests of the given resource types on every page of the context.
+
+        Args:
+            resource_types: Playwright resource types to block
+        """
+        if not self.context:
+            raise RuntimeError("Browser context not initialized")
+
+        async def handle(route):
+            if route.request.resource_type in resource_types:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await self.context.route("**/*", handle)
+
+        if self.logger:
+            self.logger.info(f"Blocking resource types: {', '.join(sorted(resource_types))}")
+
     async def scrape_members_directory(self, url: str = "https://www.classicist.org/membership-directory/") -> Dict[str, Any]:
         """Scrape the membership directory listing.
 
@@ -120,11 +430,17 @@ class ClassicistScraper:
             if self.logger:
                 self.logger.info(f"Navigating to {url}")
 
-            # Navigate to the page
+            # Navigate to the page; the listing is filled in by scripts, so
+            # wait for the network to go quiet rather than for the DOM alone
             await page.goto(url, wait_until='networkidle')
 
-            # Wait for content to load
-            await page.wait_for_timeout(2000)
+            # Then make sure the member listings have rendered
+            try:
+                await page.wait_for_selector('.list-item', state='attached', timeout=self.timeout)
+            except Exception as e:
+                # Extract whatever the page has
+                if self.logger:
+                    self.logger.warning(f"No member listings found on {url}: {e}")
 
             # Debug: Save screenshot and HTML for inspection
             if self.logger:
@@ -173,80 +489,80 @@ class ClassicistScraper:
         Returns:
             List of member dictionaries
         """
-        members = []
-
-        # Wait for member listings to load
-        await page.wait_for_timeout(1000)
-
-        # Extract member data using JavaScript
-        member_data = await page.evaluate("""
-            () => {
-                const members = [];
-
-                // Look for member listing elements - based on actual page structure
-                const memberElements = document.querySelectorAll('.list-item');
-
-                memberElements.forEach(element => {
-                    const member = {};
-
-                    // Extract name from list-item-title-name
-                    const nameElement = element.querySelector('.list-item-title-name a');
-                    if (nameElement) {
-                        member.name = nameElement.textContent.trim();
-                        member.detail_url = nameElement.href;
-                    }
-
-                    // Extract field/classification from data attributes or text
-                    const dataTitle = element.getAttribute('data-title');
-                    if (dataTitle) {
-                        member.data_title = dataTitle;
-                    }
-
-                    // Check for certified status - look for certified span
-                    const certifiedElement = element.querySelector('.certified');
-                    member.certified = certifiedElement !== null;
-
-                    // Extract profession from class (profession-XXXX)
-                    const classList = element.className.split(' ');
-                    const professionClass = classList.find(cls => cls.startsWith('profession-'));
-                    if (professionClass) {
-                        member.profession_id = professionClass.replace('profession-', '');
-                    }
-
-                    // Extract chapter from class (chapter-XXXX)
-                    const chapterClass = classList.find(cls => cls.startsWith('chapter-'));
-                    if (chapterClass) {
-                        member.chapter_id = chapterClass.replace('chapter-', '');
-                    }
-
-                    // Extract level from class (level-XXXX)
-                    const levelClass = classList.find(cls => cls.startsWith('level-'));
-                    if (levelClass) {
-                        member.level_id = levelClass.replace('level-', '');
-                    }
-
-                    // Only add if we found at least a name
-                    if (member.name) {
-                        members.push(member);
-                    }
-                });
-
-                return members;
-            }
-        """)
+        return [member async for member in self._iter_members(page)]
 
-        return member_data
+    async def _iter_members(self, page: Page, chunk: int = 200) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the directory page's members, extracted ``chunk`` list items at a time.
 
-    async def _scrape_member_detail(self, url: str) -> Dict[str, Any]:
-        """Scrape detailed information from individual member page.
+        Each batch is serialized and handed over on its own, so the browser
+        never builds (and Python never receives) the whole directory in one
+        response.
 
         Args:
-            url: Member detail page URL
+            page: Playwright page object
+            chunk: List items extracted per evaluate() call
+
+        Yields:
+            Member dictionaries, in page order
+        """
+        start = 0
+        while True:
+            batch = await page.evaluate(_DIRECTORY_MEMBERS_JS, [start, start + chunk])
+            for member in batch['members']:
+                yield member
+            start += chunk
+            if start >= batch['total']:
+                return
+
+    async def scrape_member_details(self, urls: List[str], max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """Scrape several member detail pages concurrently.
+
+        At most ``max_concurrency`` pages load at once (further capped by
+        ``max_pages``), and page loads are spaced to ``max_concurrency`` per
+        ``self.delay`` seconds. Each URL is loaded once: repeated URLs and
+        URLs scraped by earlier calls are answered from a cache of the last
+        ``DETAIL_CACHE_SIZE`` results.
+
+        Args:
+            urls: Member detail page URLs
+            max_concurrency: Number of pages loading in parallel
 
         Returns:
-            Dictionary with detailed member information
+            Detail dictionaries, in the same order as ``urls``
         """
-        detail_data = {
+        if not urls:
+            return []
+
+        # Pages come from the shared pool; the semaphore bounds this batch
+        # and the limiter spaces out page loads
+        semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        limiter = RateLimiter(max_concurrency, self.delay)
+
+        cache = self._detail_cache
+
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                await limiter.acquire()
+                return await self._scrape_member_detail(url, cache=True)
+
+        # Take the cache hits before scraping, which may evict them
+        details = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            detail = cache.get(url)
+            if detail is None:
+                pending.append(url)
+            else:
+                cache.move_to_end(url)
+                details[url] = detail
+        details.update(zip(pending, await asyncio.gather(*(scrape_one(url) for url in pending))))
+
+        return [dict(details[url]) for url in urls]
+
+    @staticmethod
+    def _empty_member_detail() -> Dict[str, Any]:
+        """Detail dictionary for a member page that could not be scraped."""
+        return {
             'about': '',
             'social_media': [],
             'photos': [],
@@ -254,78 +570,34 @@ class ClassicistScraper:
             'highlights': []
         }
 
-        try:
-            if not self.context:
-                raise RuntimeError("Browser context not initialized")
-            page = await self.context.new_page()
-            page.set_default_timeout(self.timeout)
+    async def _scrape_member_detail(self, url: str, page: Optional[Page] = None,
+                                    cache: bool = False) -> Dict[str, Any]:
+        """Scrape detailed information from individual member page.
 
-            await page.goto(url, wait_until='networkidle')
-            await page.wait_for_timeout(2000)
-
-            # Extract detailed information
-            detail_info = await page.evaluate("""
-                () => {
-                    const data = {
-                        about: '',
-                        social_media: [],
-                        photos: [],
-                        logo: '',
-                        highlights: []
-                    };
-
-                    // Extract about section
-                    const aboutElement = document.querySelector('.about, .description, .bio, [class*="about"], [class*="bio"]');
-                    if (aboutElement) {
-                        data.about = aboutElement.textContent.trim();
-                    }
-
-                    // Extract social media links
-                    const socialLinks = document.querySelectorAll('a[href*="facebook"], a[href*="twitter"], a[href*="linkedin"], a[href*="instagram"], a[href*="youtube"]');
-                    socialLinks.forEach(link => {
-                        data.social_media.push({
-                            platform: link.href.includes('facebook') ? 'facebook' :
-                                     link.href.includes('twitter') ? 'twitter' :
-                                     link.href.includes('linkedin') ? 'linkedin' :
-                                     link.href.includes('instagram') ? 'instagram' :
-                                     link.href.includes('youtube') ? 'youtube' : 'other',
-                            url: link.href,
-                            text: link.textContent.trim()
-                        });
-                    });
-
-                    // Extract photos
-                    const photoElements = document.querySelectorAll('img[src*="photo"], img[src*="image"], .photo, .image');
-                    photoElements.forEach(img => {
-                        if (img.src && !img.src.includes('logo')) {
-                            data.photos.push({
-                                url: img.src,
-                                alt: img.alt || ''
-                            });
-                        }
-                    });
-
-                    // Extract logo
-                    const logoElement = document.querySelector('img[src*="logo"], .logo img, [class*="logo"] img');
-                    if (logoElement && logoElement.src) {
-                        data.logo = logoElement.src;
-                    }
-
-                    // Extract highlights
-                    const highlightElements = document.querySelectorAll('.highlight, .achievement, .award, [class*="highlight"]');
-                    highlightElements.forEach(element => {
-                        const highlight = element.textContent.trim();
-                        if (highlight) {
-                            data.highlights.push(highlight);
-                        }
-                    });
-
-                    return data;
-                }
-            """)
+        Args:
+            url: Member detail page URL
+            page: Page to load it in; one is borrowed from the page pool
+                when omitted
+            cache: Store a successful result in the detail cache
+
+        Returns:
+            Dictionary with detailed member information
+        """
+        detail_data = self._empty_member_detail()
+
+        try:
+            if page is None:
+                async with self.acquire_page() as page:
+                    detail_info = await self._load_member_detail(page, url)
+            else:
+                detail_info = await self._load_member_detail(page, url)
 
             detail_data.update(detail_info)
-            await page.close()
+
+            if cache:
+                self._detail_cache[url] = detail_data
+                if len(self._detail_cache) > self.DETAIL_CACHE_SIZE:
+                    self._detail_cache.popitem(last=False)
 
         except Exception as e:
             if self.logger:
@@ -333,6 +605,81 @@ class ClassicistScraper:
 
         return detail_data
 
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """Download a page's HTML without rendering it.
+
+        Uses the context's request API, which shares the browser's cookies
+        and connections but skips navigation, sub-resources and layout.
+        Pages over ``MAX_HTML_BYTES`` are refused, so one oversized page
+        cannot balloon the process.
+
+        Returns:
+            The HTML, or None if the request failed or did not return HTML
+
+        Raises:
+            _PageTooLarge: The page is over ``MAX_HTML_BYTES``
+        """
+        try:
+            response = await self.context.request.get(url, timeout=self.timeout)
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Failed to fetch {url}: {e}")
+            return None
+
+        # Playwright keeps a response's body until it is disposed of
+        try:
+            if not response.ok:
+                if self.logger:
+                    self.logger.debug(f"HTTP {response.status} fetching {url}")
+                return None
+
+            headers = response.headers
+            content_type = _content_type(headers)
+            if content_type and content_type not in _HTML_CONTENT_TYPES:
+                if self.logger:
+                    self.logger.debug(f"{url} is {content_type}, not HTML")
+                return None
+
+            # Reject on the declared size before reading the body
+            length = headers.get('content-length', '')
+            if length.isdigit() and int(length) > self.MAX_HTML_BYTES:
+                raise _PageTooLarge(f"{url} is {length} bytes, over the {self.MAX_HTML_BYTES} byte limit")
+
+            body = await response.body()
+            if len(body) > self.MAX_HTML_BYTES:
+                raise _PageTooLarge(f"{url} is {len(body)} bytes, over the {self.MAX_HTML_BYTES} byte limit")
+            # Same decoding as response.text(), without reading the body twice
+            return body.decode()
+        except _PageTooLarge:
+            raise
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Failed to fetch {url}: {e}")
+            return None
+        finally:
+            await response.dispose()
+
+    async def _load_member_detail(self, page: Page, url: str) -> Dict[str, Any]:
+        """Extract a member detail page, using ``page`` to run the extractor.
+
+        The HTML is downloaded and parsed in the page with DOMParser when it
+        already contains the details; otherwise the page navigates to
+        ``url`` so its scripts can run. Pages over ``MAX_HTML_BYTES`` are
+        not navigated to either, and raise _PageTooLarge.
+        """
+        html = await self._fetch_html(url)
+        if html is not None:
+            detail_info = await page.evaluate(_MEMBER_DETAIL_FROM_HTML_JS, [html, url, _MEMBER_DETAIL_READY])
+            if detail_info is not None:
+                return detail_info
+            if self.logger:
+                self.logger.debug(f"No member details in the HTML of {url}, loading it")
+
+        await page.goto(url, wait_until='networkidle')
+
+        # Extract detailed information
+        return await page.evaluate("() => window.__extractMemberDetail()")
+
     async def scrape(self, url: str, depth: int = 1) -> Dict[str, Any]:
         """Scrape data from the given URL (legacy method for compatibility).
 
@@ -369,32 +716,23 @@ class ClassicistScraper:
         }
 
         try:
-            if not self.context:
-                raise RuntimeError("Browser context not initialized")
-
-            page = await self.context.new_page()
-            page.set_default_timeout(self.timeout)
-
-            await page.goto(url, wait_until='networkidle')
-            await page.wait_for_timeout(2000)
-
-            # Extract basic page content
-            page_data = await page.evaluate("""
-                () => {
-                    return {
-                        url: window.location.href,
-                        title: document.title,
-                        content: document.body.innerText,
-                        links: Array.from(document.querySelectorAll('a')).map(a => ({
-                            text: a.textContent.trim(),
-                            url: a.href
-                        }))
-                    };
-                }
-            """)
+            async with self.acquire_page() as page:
+                response = await page.goto(url, wait_until='networkidle')
+                content_type = _content_type(response.headers) if response else ''
+
+                # Untyped responses are sniffed by the browser, so treat them as HTML
+                if not content_type or content_type in _HTML_CONTENT_TYPES:
+                    # Extract basic page content
+                    page_data = await page.evaluate(_PAGE_CONTENT_JS)
+                else:
+                    # PDFs, images, JSON...: nothing for the extractor to read
+                    page_data = {'url': page.url, 'title': '', 'content': '', 'links': []}
+
+                if response is not None:
+                    page_data['status_code'] = response.status
+                    page_data['content_type'] = content_type
 
             results['data'].append(page_data)
-            await page.close()
 
         except Exception as e:
             error_msg = f"Failed to scrape page {url}: {str(e)}"